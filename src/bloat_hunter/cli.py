@@ -2,40 +2,39 @@
 
 from __future__ import annotations
 
+from dataclasses import dataclass, field
+from functools import lru_cache
+from operator import attrgetter
 from pathlib import Path
-from typing import cast
+from typing import TYPE_CHECKING
 
 import typer
-from rich.panel import Panel
-from rich.table import Table
 
 from bloat_hunter import __version__
 from bloat_hunter.config import (
     DEFAULT_CONFIG_TEMPLATE,
+    KEEP_STRATEGY_BY_NAME,
+    SECTION_FIELDS,
     VALID_KEEP_STRATEGIES,
     Config,
     get_config_paths,
     load_config,
     load_config_from_file,
 )
-from bloat_hunter.core.analyzer import Analyzer
-from bloat_hunter.core.cache_scanner import CacheScanner
-from bloat_hunter.core.cleaner import Cleaner
-from bloat_hunter.core.duplicates import (
-    DuplicateGroup,
-    DuplicateScanner,
-    KeepStrategy,
-)
-from bloat_hunter.core.exporter import AnyResult, ExportFormat, export_result
-from bloat_hunter.core.package_scanner import (
-    PackageManagerConfig,
-    PackageScanner,
-)
 from bloat_hunter.core.parallel import DEFAULT_WORKERS, ParallelConfig
-from bloat_hunter.core.scanner import BloatTarget, Scanner, ScanResult, parse_size
-from bloat_hunter.platform.detect import PlatformInfo, get_platform_info
 from bloat_hunter.ui.console import create_console, print_banner
-from bloat_hunter.ui.prompts import confirm_deletion, select_duplicate_groups, select_targets
+
+# Scanner, cleaner and display modules are imported inside the commands that
+# use them, so `--version`, `info` and `config` don't pay for loading them.
+if TYPE_CHECKING:
+    from collections.abc import Callable
+
+    from bloat_hunter.core.analyzer import Analyzer
+    from bloat_hunter.core.cleaner import Cleaner
+    from bloat_hunter.core.duplicates import DuplicateGroup, KeepStrategy
+    from bloat_hunter.core.exporter import AnyResult, ExportFormat
+    from bloat_hunter.core.scanner import BloatTarget
+    from bloat_hunter.platform.detect import PlatformInfo
 
 app = typer.Typer(
     name="bloat-hunter",
@@ -45,34 +44,66 @@ app = typer.Typer(
 console = create_console()
 
 
+@dataclass(slots=True)
 class State:
-    """Global state container for CLI."""
+    """Global state container for CLI, set once by the main callback."""
 
-    def __init__(self) -> None:
-        self.config: Config = Config()  # Default until loaded
+    config: Config = field(default_factory=Config)  # Default until loaded
+    quiet: bool = False  # Skip banner and platform header
 
 
 state = State()
 
 
+def _print_banner() -> None:
+    """Print the banner unless running quiet."""
+    if not state.quiet:
+        print_banner(console)
+
+
+@lru_cache(maxsize=1)
+def _get_analyzer() -> Analyzer:
+    """Get the shared Analyzer; it holds no state beyond the console."""
+    from bloat_hunter.core.analyzer import Analyzer
+
+    return Analyzer(console=console)
+
+
+@lru_cache(maxsize=2)
+def _get_cleaner(use_trash: bool) -> Cleaner:
+    """Get the shared Cleaner for the given deletion mode."""
+    from bloat_hunter.core.cleaner import Cleaner
+
+    return Cleaner(console=console, use_trash=use_trash)
+
+
 def _print_platform_header(wsl_windows: bool | None = None) -> PlatformInfo:
     """Print platform header and optionally WSL status. Returns platform_info for further use."""
+    from bloat_hunter.platform.detect import get_platform_info
+
     platform_info = get_platform_info()
-    console.print(f"[dim]Platform: {platform_info.name} ({platform_info.variant})[/dim]")
+    if state.quiet:
+        return platform_info
+    lines = [f"[dim]Platform: {platform_info.name} ({platform_info.variant})[/dim]"]
     if wsl_windows is not None and platform_info.is_wsl:
         wsl_status = "Included" if wsl_windows else "Excluded"
-        console.print(f"[dim]WSL Windows caches: {wsl_status}[/dim]")
+        lines.append(f"[dim]WSL Windows caches: {wsl_status}[/dim]")
+    console.print("\n".join(lines))
     return platform_info
 
 
 def _print_dry_run_notice() -> None:
     """Print dry run mode notice and instructions."""
-    console.print("\n[yellow]Dry run mode - no files were deleted.[/yellow]")
-    console.print("[dim]Use --execute to actually delete files.[/dim]")
+    console.print(
+        "\n[yellow]Dry run mode - no files were deleted.[/yellow]\n"
+        "[dim]Use --execute to actually delete files.[/dim]"
+    )
 
 
 def _parse_min_size(min_size: str) -> int:
     """Parse min_size string to bytes, exit with error on invalid input."""
+    from bloat_hunter.core.sizes import parse_size
+
     try:
         return parse_size(min_size)
     except ValueError as e:
@@ -80,6 +111,19 @@ def _parse_min_size(min_size: str) -> int:
         raise typer.Exit(1) from e
 
 
+def _parse_exclude(exclude: str | None) -> frozenset[str]:
+    """Parse a comma-separated list of directory names to skip."""
+    if not exclude:
+        return frozenset()
+    return frozenset(name.strip() for name in exclude.split(",") if name.strip())
+
+
+# Status markup for config file locations
+_STATUS_EXISTS = "[green]exists[/green]"
+_STATUS_OVERRIDES = "[green]exists (overrides global)[/green]"
+_STATUS_NOT_FOUND = "[dim]not found[/dim]"
+
+
 def _print_config_locations(xdg_path: Path, cwd_path: Path, *, verbose: bool = False) -> None:
     """Print config file locations and their status.
 
@@ -89,29 +133,25 @@ def _print_config_locations(xdg_path: Path, cwd_path: Path, *, verbose: bool = F
         verbose: If True, use detailed format with spacing (for config_path).
                  If False, use compact format (for config_show).
     """
+    xdg_status = _STATUS_EXISTS if xdg_path.exists() else _STATUS_NOT_FOUND
+    cwd_exists = cwd_path.exists()
+
     if verbose:
         console.print("[bold]Config file locations:[/bold]\n")
-
-        # XDG location
-        xdg_status = "[green]exists[/green]" if xdg_path.exists() else "[dim]not found[/dim]"
-        console.print(f"  Global (XDG): {xdg_path}")
-        console.print(f"                {xdg_status}\n")
-
-        # CWD location
-        cwd_status = (
-            "[green]exists (overrides global)[/green]"
-            if cwd_path.exists()
-            else "[dim]not found[/dim]"
+        cwd_status = _STATUS_OVERRIDES if cwd_exists else _STATUS_NOT_FOUND
+        console.print(
+            f"  Global (XDG): {xdg_path}\n"
+            f"                {xdg_status}\n\n"
+            f"  Local (CWD):  {cwd_path}\n"
+            f"                {cwd_status}"
         )
-        console.print(f"  Local (CWD):  {cwd_path}")
-        console.print(f"                {cwd_status}")
     else:
-        console.print("\n[bold]Config locations:[/bold]")
-        xdg_status = "[green]exists[/green]" if xdg_path.exists() else "[dim]not found[/dim]"
-        console.print(f"  Global: {xdg_path} ({xdg_status})")
-
-        cwd_status = "[green]exists[/green]" if cwd_path.exists() else "[dim]not found[/dim]"
-        console.print(f"  Local:  {cwd_path} ({cwd_status})")
+        cwd_status = _STATUS_EXISTS if cwd_exists else _STATUS_NOT_FOUND
+        console.print(
+            f"\n[bold]Config locations:[/bold]\n"
+            f"  Global: {xdg_path} ({xdg_status})\n"
+            f"  Local:  {cwd_path} ({cwd_status})"
+        )
 
 
 # Shared CLI option defaults to avoid repetition (DRY principle)
@@ -147,6 +187,39 @@ FORMAT_OPTION = typer.Option(
     help="Output format: json or csv (auto-detected from --output extension if not specified)",
 )
 
+SHOW_ALL_OPTION = typer.Option(
+    False,
+    "--all",
+    "-a",
+    help="Show all findings, not just top offenders",
+)
+
+MIN_SIZE_OPTION = typer.Option(
+    "0B",
+    "--min-size",
+    "-s",
+    help="Minimum size to report (e.g., 1MB, 10MB, 100MB)",
+)
+
+WSL_WINDOWS_OPTION = typer.Option(
+    True,
+    "--wsl-windows/--wsl-linux-only",
+    help="When in WSL, also scan Windows cache directories",
+)
+
+EXCLUDE_OPTION = typer.Option(
+    None,
+    "--exclude",
+    "-x",
+    help="Comma-separated directory names to skip entirely (e.g., .cache,vendor)",
+)
+
+SCAN_CACHE_OPTION = typer.Option(
+    True,
+    "--cache/--no-cache",
+    help="Share recent scans between scan and clean (default: cache)",
+)
+
 PARALLEL_OPTION = typer.Option(
     True,
     "--parallel/--no-parallel",
@@ -164,6 +237,13 @@ WORKERS_OPTION = typer.Option(
 
 VALID_EXPORT_FORMATS = ("json", "csv")
 
+# (section, key, accessor) for each row of `config show`, built once at import
+_CONFIG_ROWS: tuple[tuple[str, str, Callable[[Config], object]], ...] = tuple(
+    (section, key, attrgetter(f"{section}.{key}"))
+    for section, field_names in SECTION_FIELDS.items()
+    for key in field_names
+)
+
 
 def _resolve_export_format(output: Path | None, fmt: str | None) -> ExportFormat | None:
     """Resolve export format from --output path and --format flag."""
@@ -193,6 +273,8 @@ def _handle_export(
     if output is None:
         return False
 
+    from bloat_hunter.core.exporter import export_result
+
     export_format = _resolve_export_format(output, fmt)
     if export_format is None:
         if fmt is not None:
@@ -234,6 +316,8 @@ def _handle_targets_cleanup(
     Raises:
         typer.Exit: On completion, abortion, or when no items selected.
     """
+    from bloat_hunter.ui.prompts import confirm_deletion, select_targets
+
     # Interactive selection or auto-select all
     if interactive:
         selected_targets = select_targets(targets)
@@ -256,7 +340,7 @@ def _handle_targets_cleanup(
         raise typer.Exit(0)
 
     # Perform cleanup
-    cleaner = Cleaner(console=console, use_trash=trash)
+    cleaner = _get_cleaner(trash)
     cleaner.clean(selected_targets)
 
 
@@ -281,6 +365,8 @@ def _handle_duplicates_cleanup(
     Raises:
         typer.Exit: On completion, abortion, or when no items selected.
     """
+    from bloat_hunter.ui.prompts import confirm_deletion, select_duplicate_groups
+
     # Interactive selection or auto-select all
     if interactive:
         selected_groups = select_duplicate_groups(groups)
@@ -304,7 +390,7 @@ def _handle_duplicates_cleanup(
         raise typer.Exit(0)
 
     # Perform cleanup
-    cleaner = Cleaner(console=console, use_trash=trash)
+    cleaner = _get_cleaner(trash)
     cleaner.clean_duplicates(selected_groups, keep_strategy)
 
 
@@ -356,38 +442,41 @@ def scan(
         "-d",
         help="Perform deep scan (slower but finds more)",
     ),
-    show_all: bool = typer.Option(
-        False,
-        "--all",
-        "-a",
-        help="Show all findings, not just top offenders",
-    ),
-    min_size: str = typer.Option(
-        "0B",
-        "--min-size",
-        "-s",
-        help="Minimum size to report (e.g., 1MB, 10MB, 100MB)",
-    ),
+    show_all: bool = SHOW_ALL_OPTION,
+    min_size: str = MIN_SIZE_OPTION,
+    exclude: str | None = EXCLUDE_OPTION,
     parallel: bool = PARALLEL_OPTION,
     workers: int = WORKERS_OPTION,
     output: Path | None = OUTPUT_OPTION,
     fmt: str | None = FORMAT_OPTION,
+    use_cache: bool = SCAN_CACHE_OPTION,
 ) -> None:
     """Scan a directory for bloat and caches."""
-    print_banner(console)
+    from bloat_hunter.core.scan_cache import get_scan_cache_path, save_scan_result
+    from bloat_hunter.core.scanner import Scanner
 
     min_size_bytes = _parse_min_size(min_size)
     parallel_config = ParallelConfig(enabled=parallel, max_workers=workers)
 
+    _print_banner()
+
     _print_platform_header()
     if min_size_bytes > 0:
         console.print(f"[dim]Minimum size: {min_size}[/dim]")
     console.print()
 
-    scanner = Scanner(console=console, min_size=min_size_bytes, parallel_config=parallel_config)
+    exclude_names = _parse_exclude(exclude)
+    scanner = Scanner(
+        console=console,
+        min_size=min_size_bytes,
+        parallel_config=parallel_config,
+        exclude=exclude_names,
+    )
     results = scanner.scan(path, deep=deep)
+    if use_cache:
+        save_scan_result(results, get_scan_cache_path(path, deep, min_size_bytes, exclude_names))
 
-    analyzer = Analyzer(console=console)
+    analyzer = _get_analyzer()
     analyzer.display_results(results, show_all=show_all)
 
     _handle_export(results, output, fmt)
@@ -403,35 +492,67 @@ def clean(
         dir_okay=True,
         resolve_path=True,
     ),
+    deep: bool = typer.Option(
+        True,
+        "--deep/--shallow",
+        help="Scan as deep as `scan --deep` (default) or as shallow as plain `scan`",
+    ),
     dry_run: bool = DRY_RUN_OPTION,
     trash: bool = TRASH_OPTION,
     interactive: bool = INTERACTIVE_OPTION,
-    min_size: str = typer.Option(
-        "0B",
-        "--min-size",
-        "-s",
-        help="Minimum size to report (e.g., 1MB, 10MB, 100MB)",
-    ),
+    min_size: str = MIN_SIZE_OPTION,
+    exclude: str | None = EXCLUDE_OPTION,
+    use_cache: bool = SCAN_CACHE_OPTION,
     parallel: bool = PARALLEL_OPTION,
     workers: int = WORKERS_OPTION,
 ) -> None:
-    """Clean up bloat and caches from a directory."""
-    print_banner(console)
+    """Clean up bloat and caches from a directory.
+
+    Reuses a scan of the same path from the last few minutes if it was run
+    with the same depth, --min-size and --exclude: `scan --deep` for a plain
+    `clean`, or a plain `scan` for `clean --shallow`.
+    """
+    from bloat_hunter.core.scan_cache import (
+        clear_scan_result,
+        get_scan_cache_path,
+        load_scan_result,
+        save_scan_result,
+    )
+    from bloat_hunter.core.scanner import Scanner
 
     min_size_bytes = _parse_min_size(min_size)
     parallel_config = ParallelConfig(enabled=parallel, max_workers=workers)
 
+    _print_banner()
+
     if min_size_bytes > 0:
         console.print(f"[dim]Minimum size: {min_size}[/dim]")
 
-    scanner = Scanner(console=console, min_size=min_size_bytes, parallel_config=parallel_config)
-    results = scanner.scan(path, deep=True)
+    exclude_names = _parse_exclude(exclude)
+    cache_path = get_scan_cache_path(path, deep, min_size_bytes, exclude_names)
+    cached = load_scan_result(path, cache_path) if use_cache else None
+
+    if cached is not None:
+        results, age = cached
+        console.print(
+            f"[dim]Reusing scan from {age:.0f}s ago (use --no-cache to rescan)[/dim]"
+        )
+    else:
+        scanner = Scanner(
+            console=console,
+            min_size=min_size_bytes,
+            parallel_config=parallel_config,
+            exclude=exclude_names,
+        )
+        results = scanner.scan(path, deep=deep)
+        if use_cache:
+            save_scan_result(results, cache_path)
 
     if not results.targets:
         console.print("[green]No bloat found! Your disk is clean.[/green]")
         raise typer.Exit(0)
 
-    analyzer = Analyzer(console=console)
+    analyzer = _get_analyzer()
     _handle_cleanup_flow(
         targets=results.targets,
         analyzer=analyzer,
@@ -440,6 +561,9 @@ def clean(
         trash=trash,
     )
 
+    # _handle_cleanup_flow exits on dry runs and aborts, so targets were deleted
+    clear_scan_result(cache_path)
+
 
 @app.command()
 def duplicates(
@@ -476,33 +600,48 @@ def duplicates(
     workers: int = WORKERS_OPTION,
     output: Path | None = OUTPUT_OPTION,
     fmt: str | None = FORMAT_OPTION,
+    use_cache: bool = typer.Option(
+        True,
+        "--cache/--no-cache",
+        help="Reuse file hashes of unchanged files from previous runs",
+    ),
 ) -> None:
     """Find and optionally remove duplicate files."""
-    print_banner(console)
+    from bloat_hunter.core.duplicates import DuplicateScanner
+    from bloat_hunter.core.hash_cache import HashCache
 
     # Validate keep strategy
-    if keep not in VALID_KEEP_STRATEGIES:
+    keep_strategy = KEEP_STRATEGY_BY_NAME.get(keep)
+    if keep_strategy is None:
         console.print(f"[red]Invalid keep strategy: {keep}[/red]")
         console.print(f"[dim]Valid options: {', '.join(VALID_KEEP_STRATEGIES)}[/dim]")
         raise typer.Exit(1)
 
-    keep_strategy = cast(KeepStrategy, keep)
-
     min_size_bytes = _parse_min_size(min_size)
     parallel_config = ParallelConfig(enabled=parallel, max_workers=workers)
 
+    _print_banner()
+
     _print_platform_header()
     console.print(f"[dim]Minimum file size: {min_size}[/dim]")
     console.print()
 
     # Scan for duplicates
+    hash_cache = HashCache() if use_cache else None
     scanner = DuplicateScanner(
-        console=console, min_size=min_size_bytes, parallel_config=parallel_config
+        console=console,
+        min_size=min_size_bytes,
+        parallel_config=parallel_config,
+        hash_cache=hash_cache,
     )
-    results = scanner.scan(path)
+    try:
+        results = scanner.scan(path)
+    finally:
+        if hash_cache is not None:
+            hash_cache.close()
 
     # Display results
-    analyzer = Analyzer(console=console)
+    analyzer = _get_analyzer()
     analyzer.display_duplicate_results(results, show_all=show_all)
 
     _handle_export(results, output, fmt)
@@ -540,24 +679,18 @@ def caches(
         "--apps/--no-apps",
         help="Include application caches (VS Code, Slack, Discord, etc.)",
     ),
-    wsl_windows: bool = typer.Option(
-        True,
-        "--wsl-windows/--wsl-linux-only",
-        help="When in WSL, also scan Windows cache directories",
-    ),
-    show_all: bool = typer.Option(
-        False,
-        "--all",
-        "-a",
-        help="Show all findings, not just top offenders",
-    ),
+    wsl_windows: bool = WSL_WINDOWS_OPTION,
+    show_all: bool = SHOW_ALL_OPTION,
     parallel: bool = PARALLEL_OPTION,
     workers: int = WORKERS_OPTION,
     output: Path | None = OUTPUT_OPTION,
     fmt: str | None = FORMAT_OPTION,
 ) -> None:
     """Scan and clean system cache directories (browsers, package managers, apps)."""
-    print_banner(console)
+    from bloat_hunter.core.cache_scanner import CacheScanner
+    from bloat_hunter.core.scanner import ScanResult
+
+    _print_banner()
     platform_info = _print_platform_header(wsl_windows=wsl_windows)
     console.print()
 
@@ -581,15 +714,16 @@ def caches(
         scan_errors=results.scan_errors,
     )
 
-    analyzer = Analyzer(console=console)
+    analyzer = _get_analyzer()
     analyzer.display_results(display_result, show_all=show_all)
 
     # Show category breakdown
     if results.categories_scanned:
-        console.print("\n[bold]Categories scanned:[/bold]")
+        lines = ["\n[bold]Categories scanned:[/bold]"]
         for cat, count in results.categories_scanned.items():
             cat_label = cat.replace("_", " ").title()
-            console.print(f"  - {cat_label}: {count} locations")
+            lines.append(f"  - {cat_label}: {count} locations")
+        console.print("\n".join(lines))
 
     # Export the full CacheScanResult (not display_result) for richer data
     _handle_export(results, output, fmt)
@@ -623,24 +757,17 @@ def packages(
     composer: bool = typer.Option(True, "--composer/--no-composer", help="Include Composer cache"),
     nuget: bool = typer.Option(True, "--nuget/--no-nuget", help="Include NuGet cache"),
     bundler: bool = typer.Option(True, "--bundler/--no-bundler", help="Include Bundler cache"),
-    wsl_windows: bool = typer.Option(
-        True,
-        "--wsl-windows/--wsl-linux-only",
-        help="When in WSL, also scan Windows cache directories",
-    ),
-    show_all: bool = typer.Option(
-        False,
-        "--all",
-        "-a",
-        help="Show all findings, not just top offenders",
-    ),
+    wsl_windows: bool = WSL_WINDOWS_OPTION,
+    show_all: bool = SHOW_ALL_OPTION,
     parallel: bool = PARALLEL_OPTION,
     workers: int = WORKERS_OPTION,
     output: Path | None = OUTPUT_OPTION,
     fmt: str | None = FORMAT_OPTION,
 ) -> None:
     """Scan and clean package manager caches (npm, pip, cargo, etc.)."""
-    print_banner(console)
+    from bloat_hunter.core.package_scanner import PackageManagerConfig, PackageScanner
+
+    _print_banner()
     _print_platform_header(wsl_windows=wsl_windows)
     console.print()
 
@@ -663,7 +790,7 @@ def packages(
 
     results = scanner.scan(wsl_include_windows=wsl_windows)
 
-    analyzer = Analyzer(console=console)
+    analyzer = _get_analyzer()
     analyzer.display_package_results(results, show_all=show_all)
 
     _handle_export(results, output, fmt)
@@ -684,20 +811,25 @@ def packages(
 @app.command()
 def info() -> None:
     """Show system and platform information."""
-    print_banner(console)
+    from bloat_hunter.platform.detect import get_platform_info
+
+    _print_banner()
 
     platform_info = get_platform_info()
 
-    console.print("[bold]System Information[/bold]\n")
-    console.print(f"  Platform: {platform_info.name}")
-    console.print(f"  Variant:  {platform_info.variant}")
-    console.print(f"  Home:     {platform_info.home_dir}")
+    lines = [
+        "[bold]System Information[/bold]\n",
+        f"  Platform: {platform_info.name}",
+        f"  Variant:  {platform_info.variant}",
+        f"  Home:     {platform_info.home_dir}",
+    ]
 
     if platform_info.is_wsl:
-        console.print(f"  WSL:      Yes ({platform_info.wsl_distro})")
-        console.print(f"  Windows:  {platform_info.windows_home}")
+        lines.append(f"  WSL:      Yes ({platform_info.wsl_distro})")
+        lines.append(f"  Windows:  {platform_info.windows_home}")
 
-    console.print(f"\n[dim]Bloat Hunter v{__version__}[/dim]")
+    lines.append(f"\n[dim]Bloat Hunter v{__version__}[/dim]")
+    console.print("\n".join(lines))
 
 
 # Config subcommand group
@@ -735,7 +867,7 @@ def config_init(
     # Ensure parent directory exists
     try:
         target.parent.mkdir(parents=True, exist_ok=True)
-        target.write_text(DEFAULT_CONFIG_TEMPLATE)
+        target.write_bytes(DEFAULT_CONFIG_TEMPLATE.encode("utf-8"))
     except OSError as e:
         console.print(f"[red]Permission denied: {target}[/red]")
         console.print(f"[dim]Check write permissions for {target.parent}[/dim]")
@@ -754,6 +886,9 @@ def config_show(
     ),
 ) -> None:
     """Display the active configuration and its source."""
+    from rich.panel import Panel
+    from rich.table import Table
+
     config = state.config
     xdg_path, cwd_path = get_config_paths()
 
@@ -773,17 +908,14 @@ def config_show(
         table.add_column("Key", style="green")
         table.add_column("Value")
 
-        for section_name in ["defaults", "packages", "caches", "duplicates", "scan"]:
-            section = getattr(config, section_name)
-            for key, value in vars(section).items():
-                if not key.startswith("_"):
-                    table.add_row(section_name, key, str(value))
+        for section_name, key, accessor in _CONFIG_ROWS:
+            table.add_row(section_name, key, str(accessor(config)))
 
         console.print(table)
     else:
         # Show raw file content
         if config._source and config._source.exists():
-            console.print(config._source.read_text())
+            console.print(config._source.read_text(encoding="utf-8"))
         else:
             console.print("[dim]No config file found[/dim]")
 
@@ -807,6 +939,12 @@ def main(
         help="Show version and exit",
         is_eager=True,
     ),
+    quiet: bool | None = typer.Option(
+        None,
+        "--quiet/--no-quiet",
+        "-q",
+        help="Skip the banner and platform header (default: quiet when output is piped)",
+    ),
     config_file: Path | None = typer.Option(
         None,
         "--config",
@@ -821,6 +959,8 @@ def main(
         console.print(f"Bloat Hunter v{__version__}")
         raise typer.Exit(0)
 
+    state.quiet = not console.is_terminal if quiet is None else quiet
+
     # Load config (custom file or default locations)
     if config_file:
         try:
@@ -5,6 +5,7 @@ from __future__ import annotations
 import os
 import sys
 from dataclasses import dataclass, field, fields
+from functools import lru_cache
 from pathlib import Path
 from typing import Any, Literal
 
@@ -14,14 +15,26 @@ if sys.version_info >= (3, 11):
 else:
     import tomli as tomllib  # type: ignore[import-not-found]
 
-from bloat_hunter.core.scanner import parse_size
+# Prefer the Rust-backed TOML parser when installed (pip install bloat-hunter[speedups])
+try:
+    from rtoml import TomlParsingError as _RtomlError  # type: ignore[import-not-found]
+    from rtoml import loads as _parse_toml
+
+    _TOML_DECODE_ERRORS: tuple[type[Exception], ...] = (_RtomlError,)
+except ImportError:
+    _parse_toml = tomllib.loads
+    _TOML_DECODE_ERRORS = (tomllib.TOMLDecodeError,)
+
+from bloat_hunter.core.sizes import parse_size
 
 # Type alias for keep strategy
 KeepStrategy = Literal["first", "shortest", "oldest", "newest"]
 VALID_KEEP_STRATEGIES: tuple[KeepStrategy, ...] = ("first", "shortest", "oldest", "newest")
+# Validates and narrows a user-supplied strategy name in one lookup
+KEEP_STRATEGY_BY_NAME: dict[str, KeepStrategy] = {k: k for k in VALID_KEEP_STRATEGIES}
 
 
-@dataclass
+@dataclass(slots=True, frozen=True)
 class DefaultsConfig:
     """Default behavior options."""
 
@@ -31,7 +44,7 @@ class DefaultsConfig:
     wsl_windows: bool = True
 
 
-@dataclass
+@dataclass(slots=True, frozen=True)
 class PackagesConfig:
     """Package manager cache settings."""
 
@@ -48,7 +61,7 @@ class PackagesConfig:
     bundler: bool = True
 
 
-@dataclass
+@dataclass(slots=True, frozen=True)
 class CachesConfig:
     """Cache category settings."""
 
@@ -57,7 +70,7 @@ class CachesConfig:
     apps: bool = True
 
 
-@dataclass
+@dataclass(slots=True, frozen=True)
 class DuplicatesConfig:
     """Duplicate detection settings."""
 
@@ -73,7 +86,7 @@ class DuplicatesConfig:
             return 1048576  # 1MB fallback
 
 
-@dataclass
+@dataclass(slots=True, frozen=True)
 class ScanConfig:
     """General scan settings."""
 
@@ -90,7 +103,7 @@ class ScanConfig:
             return 0  # No filter fallback
 
 
-@dataclass
+@dataclass(slots=True)
 class Config:
     """Root configuration container."""
 
@@ -104,18 +117,45 @@ class Config:
     _source: Path | None = field(default=None, repr=False)
 
 
+# Returned by load_config() when no config file exists; treat as read-only
+_DEFAULT_CONFIG = Config()
+
+
+@lru_cache(maxsize=1)
 def get_xdg_config_home() -> Path:
-    """Get XDG config home, respecting environment variable."""
+    """
+    Get XDG config home, respecting environment variable.
+
+    Computed once per process; call get_xdg_config_home.cache_clear() after
+    changing XDG_CONFIG_HOME.
+    """
     xdg = os.environ.get("XDG_CONFIG_HOME")
     if xdg:
         return Path(xdg)
     return Path.home() / ".config"
 
 
+def get_xdg_cache_home() -> Path:
+    """Get XDG cache home, respecting environment variable."""
+    xdg = os.environ.get("XDG_CACHE_HOME")
+    if xdg:
+        return Path(xdg)
+    return Path.home() / ".cache"
+
+
+def get_cache_dir() -> Path:
+    """Get the directory for bloat-hunter's own cache files."""
+    return get_xdg_cache_home() / "bloat-hunter"
+
+
+@lru_cache(maxsize=1)
 def get_config_paths() -> tuple[Path, Path]:
     """
     Get config file paths in priority order.
 
+    Computed once per process, as the CLI never changes directory; call
+    get_config_paths.cache_clear() after changing the environment or cwd.
+
     Returns:
         (xdg_path, cwd_path) - XDG is base, CWD overrides
     """
@@ -125,20 +165,58 @@ def get_config_paths() -> tuple[Path, Path]:
 
 
 def _load_toml(path: Path) -> dict[str, Any]:
-    """Load and parse a TOML file."""
-    with open(path, "rb") as f:
-        result: dict[str, Any] = tomllib.load(f)
-        return result
+    """
+    Load and parse a TOML file.
+
+    Raises:
+        ValueError: If the file is not valid TOML
+    """
+    try:
+        result: dict[str, Any] = _parse_toml(path.read_text(encoding="utf-8"))
+    except _TOML_DECODE_ERRORS as e:
+        raise ValueError(f"Invalid TOML in {path}: {e}") from e
+    return result
+
+
+def _load_optional_toml(path: Path) -> dict[str, Any] | None:
+    """
+    Load a TOML config file if it exists.
+
+    A file removed since it was stamped is treated as absent.
+
+    Returns:
+        Parsed data, or None if the file does not exist.
+
+    Raises:
+        ValueError: If the file is not valid TOML
+    """
+    try:
+        return _load_toml(path)
+    except (FileNotFoundError, NotADirectoryError):
+        return None
 
 
 def _merge_dicts(base: dict[str, Any], override: dict[str, Any]) -> dict[str, Any]:
-    """Deep merge two dictionaries, override takes precedence."""
+    """
+    Deep merge two dictionaries, override takes precedence.
+
+    Neither input is modified. Nested dicts are copied only where both sides
+    hold a dict for the same key, and merged with an explicit stack rather
+    than recursion.
+    """
     result = base.copy()
-    for key, value in override.items():
-        if key in result and isinstance(result[key], dict) and isinstance(value, dict):
-            result[key] = _merge_dicts(result[key], value)
-        else:
-            result[key] = value
+    stack = [(result, override)]
+
+    while stack:
+        target, source = stack.pop()
+        for key, value in source.items():
+            current = target.get(key)
+            if isinstance(current, dict) and isinstance(value, dict):
+                target[key] = current = current.copy()
+                stack.append((current, value))
+            else:
+                target[key] = value
+
     return result
 
 
@@ -146,15 +224,17 @@ def _validate_config(data: dict[str, Any]) -> list[str]:
     """Validate TOML data and return list of errors."""
     errors: list[str] = []
 
+    duplicates = data.get("duplicates", {})
+
     # Check keep strategy
-    keep = data.get("duplicates", {}).get("keep")
-    if keep and keep not in VALID_KEEP_STRATEGIES:
+    keep = duplicates.get("keep")
+    if keep and keep not in KEEP_STRATEGY_BY_NAME:
         errors.append(
             f"Invalid duplicates.keep: '{keep}' (use: first, shortest, oldest, newest)"
         )
 
     # Check min_size format for duplicates
-    min_size = data.get("duplicates", {}).get("min_size")
+    min_size = duplicates.get("min_size")
     if min_size:
         try:
             parse_size(min_size)
@@ -172,12 +252,6 @@ def _validate_config(data: dict[str, Any]) -> list[str]:
     return errors
 
 
-def _filter_known_keys(data: dict[str, Any], dataclass_type: type) -> dict[str, Any]:
-    """Filter dict to only include keys that are valid fields for the dataclass."""
-    valid_fields = {f.name for f in fields(dataclass_type)}
-    return {k: v for k, v in data.items() if k in valid_fields}
-
-
 # Mapping of section names to their config classes
 SECTION_TYPES = {
     "defaults": DefaultsConfig,
@@ -187,11 +261,26 @@ SECTION_TYPES = {
     "scan": ScanConfig,
 }
 
+# Field names of each section in declaration order, resolved once instead of per load
+SECTION_FIELDS: dict[str, tuple[str, ...]] = {
+    name: tuple(f.name for f in fields(cls)) for name, cls in SECTION_TYPES.items()
+}
+
+# Same field names as sets, for filtering parsed sections
+_SECTION_FIELD_SETS: dict[str, frozenset[str]] = {
+    name: frozenset(names) for name, names in SECTION_FIELDS.items()
+}
+
+
+def _filter_known_keys(data: dict[str, Any], section: str) -> dict[str, Any]:
+    """Filter dict to only include keys that are valid fields for the section."""
+    return {k: data[k] for k in data.keys() & _SECTION_FIELD_SETS[section]}
+
 
 def _dict_to_config(data: dict[str, Any], source: Path | None = None) -> Config:
     """Convert parsed TOML dict to Config dataclass."""
     sections = {
-        name: cls(**_filter_known_keys(data.get(name, {}), cls))
+        name: cls(**_filter_known_keys(data.get(name, {}), name))
         for name, cls in SECTION_TYPES.items()
     }
     return Config(**sections, _source=source)
@@ -207,31 +296,56 @@ def load_config() -> Config:
     3. Built-in defaults
 
     Returns:
-        Merged Config instance
+        Merged Config instance, shared between calls while the config files
+        are unchanged, so callers must not modify it.
 
     Raises:
         ValueError: If TOML syntax is invalid in either config file
     """
     xdg_path, cwd_path = get_config_paths()
+    return _load_config_cached(xdg_path, _file_stamp(xdg_path), cwd_path, _file_stamp(cwd_path))
+
+
+def _file_stamp(path: Path) -> tuple[int, int] | None:
+    """Get (mtime_ns, size) of a file, or None if it does not exist."""
+    try:
+        st = path.stat()
+    except (FileNotFoundError, NotADirectoryError):
+        return None
+    return st.st_mtime_ns, st.st_size
+
+
+@lru_cache(maxsize=4)
+def _load_config_cached(
+    xdg_path: Path,
+    xdg_stamp: tuple[int, int] | None,
+    cwd_path: Path,
+    cwd_stamp: tuple[int, int] | None,
+) -> Config:
+    """
+    Load and merge the config files for load_config().
+
+    Cached on each file's (mtime_ns, size) stamp, so repeat loads in one
+    process skip reading and parsing until a file changes.
+    """
+    if xdg_stamp is None and cwd_stamp is None:
+        return _DEFAULT_CONFIG
+
+    xdg_data = _load_optional_toml(xdg_path) if xdg_stamp is not None else None
+    cwd_data = _load_optional_toml(cwd_path) if cwd_stamp is not None else None
 
     merged_data: dict[str, Any] = {}
     active_source: Path | None = None
 
-    # Load XDG config if exists
-    if xdg_path.exists():
-        try:
-            merged_data = _load_toml(xdg_path)
-        except tomllib.TOMLDecodeError as e:
-            raise ValueError(f"Invalid TOML in {xdg_path}: {e}") from e
+    # XDG config is the base
+    if xdg_data is not None:
+        merged_data = xdg_data
         active_source = xdg_path
 
-    # Merge CWD config if exists (overrides XDG)
-    if cwd_path.exists():
-        try:
-            cwd_data = _load_toml(cwd_path)
-        except tomllib.TOMLDecodeError as e:
-            raise ValueError(f"Invalid TOML in {cwd_path}: {e}") from e
-        merged_data = _merge_dicts(merged_data, cwd_data)
+    # CWD config overrides XDG
+    if cwd_data is not None:
+        # Only merge when there is a base to merge into
+        merged_data = _merge_dicts(merged_data, cwd_data) if merged_data else cwd_data
         active_source = cwd_path
 
     # Validate merged config data
@@ -2,8 +2,28 @@
 
 from __future__ import annotations
 
-from .analyzer import Analyzer
-from .cleaner import Cleaner
-from .scanner import Scanner
+import importlib
+from typing import TYPE_CHECKING, Any
+
+if TYPE_CHECKING:
+    from .analyzer import Analyzer
+    from .cleaner import Cleaner
+    from .scanner import Scanner
 
 __all__ = ["Scanner", "Analyzer", "Cleaner"]
+
+# Submodules are loaded on first attribute access (PEP 562), so importing a
+# single module such as core.parallel doesn't drag in the whole package.
+_LAZY_ATTRS = {
+    "Scanner": "scanner",
+    "Analyzer": "analyzer",
+    "Cleaner": "cleaner",
+}
+
+
+def __getattr__(name: str) -> Any:
+    module_name = _LAZY_ATTRS.get(name)
+    if module_name is None:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    module = importlib.import_module(f".{module_name}", __name__)
+    return getattr(module, name)
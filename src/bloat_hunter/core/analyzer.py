@@ -2,13 +2,30 @@
 
 from __future__ import annotations
 
+from collections.abc import Sequence
+from typing import TYPE_CHECKING
+
 from rich.console import Console
 from rich.panel import Panel
 from rich.table import Table
 
-from bloat_hunter.core.duplicates import DuplicateGroup, DuplicateResult, KeepStrategy
-from bloat_hunter.core.package_scanner import PackageScanResult, _get_manager_for_pattern
-from bloat_hunter.core.scanner import BloatTarget, ScanResult, format_size
+from bloat_hunter.core.sizes import format_size
+
+# Result types are only needed for annotations; importing them at runtime would
+# load the duplicate and package scanners for every command that displays output
+if TYPE_CHECKING:
+    from bloat_hunter.core.duplicates import DuplicateGroup, DuplicateResult, KeepStrategy
+    from bloat_hunter.core.package_scanner import PackageScanResult
+    from bloat_hunter.core.scanner import BloatTarget, ScanResult
+
+# Rows shown without --all. Scanners return results sorted by size, so the
+# top offenders are a slice rather than a fresh selection.
+TOP_K = 20
+
+# Above this many rows, tables sent to a pipe or file are printed as plain
+# aligned lines instead; Rich measures every cell to lay out a table, which
+# gets slow with --all on large results. Terminals always get the table.
+PLAIN_ROWS_THRESHOLD = 500
 
 
 class Analyzer:
@@ -25,6 +42,37 @@ class Analyzer:
                 f"Use --all to see everything.[/dim]"
             )
 
+    def _print_rows(self, table: Table, rows: Sequence[tuple[str, ...]]) -> None:
+        """Print rows in table, or as plain text past PLAIN_ROWS_THRESHOLD when not a terminal."""
+        if len(rows) <= PLAIN_ROWS_THRESHOLD or self.console.is_terminal:
+            for row in rows:
+                table.add_row(*row)
+            self.console.print(table)
+            return
+
+        # Pad every column but the last (usually a path) to its widest cell,
+        # keeping each column's justification
+        headers = tuple(str(column.header) for column in table.columns)
+        pads = [
+            (
+                max(len(headers[i]), *(len(row[i]) for row in rows)),
+                str.rjust if table.columns[i].justify == "right" else str.ljust,
+            )
+            for i in range(len(headers) - 1)
+        ]
+
+        def format_row(cells: tuple[str, ...]) -> str:
+            padded = [pad(cell, width) for cell, (width, pad) in zip(cells[:-1], pads, strict=True)]
+            return "  ".join([*padded, cells[-1]])
+
+        lines = [format_row(headers), *(format_row(row) for row in rows)]
+        if table.title:
+            lines.insert(0, str(table.title))
+        self.console.print(
+            f"[dim]{len(rows)} rows: printing plain text instead of a table.[/dim]"
+        )
+        self.console.print("\n".join(lines), markup=False, highlight=False, soft_wrap=True)
+
     def _print_scan_errors(self, errors: list[str]) -> None:
         """Print notice about skipped directories due to errors."""
         if errors:
@@ -60,20 +108,15 @@ class Analyzer:
         table.add_column("Type", style="green", width=15)
         table.add_column("Path", style="white", overflow="ellipsis")
 
-        # Show top 20 or all
-        targets_to_show = result.targets if show_all else result.targets[:20]
-
-        for i, target in enumerate(targets_to_show, 1):
-            table.add_row(
-                str(i),
-                target.size_human,
-                target.category,
-                target.pattern.name,
-                str(target.path),
-            )
+        # Show top TOP_K or all
+        targets_to_show = result.targets if show_all else result.targets[:TOP_K]
 
-        self.console.print(table)
-        self._print_truncation_notice(20, len(result.targets), "targets")
+        rows = [
+            (str(i), t.size_human, t.category, t.pattern.name, str(t.path))
+            for i, t in enumerate(targets_to_show, 1)
+        ]
+        self._print_rows(table, rows)
+        self._print_truncation_notice(len(targets_to_show), len(result.targets), "targets")
         self._print_scan_errors(result.scan_errors)
 
     def display_deletion_preview(self, targets: list[BloatTarget]) -> None:
@@ -87,14 +130,8 @@ class Analyzer:
         table.add_column("Type", style="yellow", width=15)
         table.add_column("Path", style="white")
 
-        for target in targets:
-            table.add_row(
-                target.size_human,
-                target.pattern.name,
-                str(target.path),
-            )
-
-        self.console.print(table)
+        rows = [(t.size_human, t.pattern.name, str(t.path)) for t in targets]
+        self._print_rows(table, rows)
         self.console.print(
             f"\n[bold]Total to be freed:[/bold] [cyan]{format_size(total_size)}[/cyan]"
         )
@@ -131,20 +168,15 @@ class Analyzer:
         table.add_column("Wasted", justify="right", style="red", width=10)
         table.add_column("Hash", style="dim", width=16)
 
-        # Show top 20 or all
-        groups_to_show = result.groups if show_all else result.groups[:20]
+        # Show top TOP_K or all
+        groups_to_show = result.groups if show_all else result.groups[:TOP_K]
 
-        for i, group in enumerate(groups_to_show, 1):
-            table.add_row(
-                str(i),
-                group.size_human,
-                str(len(group.files)),
-                group.wasted_human,
-                group.hash_value[:16],
-            )
-
-        self.console.print(table)
-        self._print_truncation_notice(20, len(result.groups), "groups")
+        rows = [
+            (str(i), g.size_human, str(len(g.files)), g.wasted_human, g.hash_value[:16])
+            for i, g in enumerate(groups_to_show, 1)
+        ]
+        self._print_rows(table, rows)
+        self._print_truncation_notice(len(groups_to_show), len(result.groups), "groups")
         self._print_scan_errors(result.scan_errors)
 
     def display_duplicate_group(self, group: DuplicateGroup, index: int = 0) -> None:
@@ -173,7 +205,7 @@ class Analyzer:
         table.add_column("Keep", style="green")
         table.add_column("Delete", style="red")
 
-        for group in groups[:20]:  # Limit preview
+        for group in groups[:TOP_K]:  # Limit preview
             keep_file = group.get_keep_file(strategy)
             delete_files = group.get_duplicates_to_remove(strategy)
 
@@ -185,8 +217,8 @@ class Analyzer:
 
         self.console.print(table)
 
-        if len(groups) > 20:
-            self.console.print(f"\n[dim]... and {len(groups) - 20} more groups[/dim]")
+        if len(groups) > TOP_K:
+            self.console.print(f"\n[dim]... and {len(groups) - TOP_K} more groups[/dim]")
 
         self.console.print(
             f"\n[bold]Total to delete:[/bold] {total_to_delete} files"
@@ -199,6 +231,8 @@ class Analyzer:
         self, result: PackageScanResult, show_all: bool = False
     ) -> None:
         """Display package manager cache scan results with per-manager breakdown."""
+        from bloat_hunter.core.package_scanner import _get_manager_for_pattern
+
         if not result.targets:
             self.console.print("[green]No package cache bloat found![/green]")
             return
@@ -257,19 +291,19 @@ class Analyzer:
         table.add_column("Type", style="green", width=15)
         table.add_column("Path", style="white", overflow="ellipsis")
 
-        # Show top 20 or all
-        targets_to_show = result.targets if show_all else result.targets[:20]
+        # Show top TOP_K or all
+        targets_to_show = result.targets if show_all else result.targets[:TOP_K]
 
-        for i, target in enumerate(targets_to_show, 1):
-            manager = _get_manager_for_pattern(target.pattern.name) or "unknown"
-            table.add_row(
+        rows = [
+            (
                 str(i),
-                target.size_human,
-                manager,
-                target.pattern.name,
-                str(target.path),
+                t.size_human,
+                _get_manager_for_pattern(t.pattern.name) or "unknown",
+                t.pattern.name,
+                str(t.path),
             )
-
-        self.console.print(table)
-        self._print_truncation_notice(20, len(result.targets), "targets")
+            for i, t in enumerate(targets_to_show, 1)
+        ]
+        self._print_rows(table, rows)
+        self._print_truncation_notice(len(targets_to_show), len(result.targets), "targets")
         self._print_scan_errors(result.scan_errors)
@@ -2,28 +2,25 @@
 
 from __future__ import annotations
 
+import os
+from collections.abc import Callable
 from dataclasses import dataclass, field
+from operator import attrgetter
 from pathlib import Path
 
 from rich.console import Console
-from rich.progress import (
-    BarColumn,
-    Progress,
-    SpinnerColumn,
-    TaskProgressColumn,
-    TextColumn,
-)
 
 from bloat_hunter.core.parallel import ParallelConfig, parallel_map
 from bloat_hunter.core.scanner import (
     BloatTarget,
     calc_target,
     collect_pattern_matches,
-    format_size,
-    match_patterns,
+    scan_progress,
+    sizing_reporter,
 )
+from bloat_hunter.core.sizes import format_size
 from bloat_hunter.patterns import get_system_cache_patterns
-from bloat_hunter.patterns.base import BloatPattern
+from bloat_hunter.patterns.base import BloatPattern, PatternMatcher
 from bloat_hunter.platform.detect import (
     PlatformInfo,
     get_all_cache_paths,
@@ -62,6 +59,7 @@ class CacheScanner:
         self.include_package_managers = include_package_managers
         self.include_apps = include_apps
         self.patterns = get_system_cache_patterns()
+        self._matcher = PatternMatcher(self.patterns)
         self.parallel_config = parallel_config or ParallelConfig()
 
     def scan(self, wsl_include_windows: bool = True) -> CacheScanResult:
@@ -108,81 +106,55 @@ class CacheScanner:
         if not paths_to_scan:
             return result
 
-        # Phase 1: Collect all matching paths
-        matches: list[tuple[Path, BloatPattern]] = []
-
-        with Progress(
-            SpinnerColumn(),
-            TextColumn("[progress.description]{task.description}"),
-            BarColumn(),
-            TaskProgressColumn(),
-            console=self.console,
-        ) as progress:
-            task = progress.add_task(
-                "Scanning system caches...", total=len(paths_to_scan)
-            )
+        for category, _ in paths_to_scan:
+            result.categories_scanned[category] = result.categories_scanned.get(category, 0) + 1
 
-            for category, cache_path in paths_to_scan:
-                progress.update(task, description=f"Scanning: {cache_path.name}")
+        # Phase 1: Collect all matching paths, walking every cache root at once
+        matches: list[tuple[str, BloatPattern]] = []
 
-                try:
-                    self._collect_matches(cache_path, matches, result, depth=0)
-                    result.categories_scanned[category] = (
-                        result.categories_scanned.get(category, 0) + 1
-                    )
-                except (PermissionError, OSError) as e:
-                    result.scan_errors.append(f"{cache_path}: {e}")
+        with scan_progress(self.console) as progress:
+            task = progress.add_task("Scanning system caches...", total=None)
 
-                progress.advance(task)
+            def on_dir(dir_path: str) -> None:
+                progress.update(task, description=f"Scanning: {os.path.basename(dir_path)[:40]}")
 
-        if not matches:
-            return result
+            self._collect_matches([p for _, p in paths_to_scan], matches, result, on_dir)
 
-        # Phase 2: Calculate sizes in parallel
-        with Progress(
-            SpinnerColumn(),
-            TextColumn("[progress.description]{task.description}"),
-            BarColumn(),
-            TaskProgressColumn(),
-            console=self.console,
-        ) as progress:
+            if not matches:
+                return result
+
+            # Phase 2: Calculate sizes in parallel
+            progress.update(task, visible=False)
             task = progress.add_task("Calculating sizes...", total=len(matches))
+            report = sizing_reporter(progress, task, len(matches))
 
             for item, target, error in parallel_map(
                 calc_target, matches, self.parallel_config
             ):
-                path, _ = item
-                progress.update(task, description=f"Sizing: {path.name[:40]}")
+                report(item[0])
 
                 if error is None and target is not None:
                     result.targets.append(target)
 
-                progress.advance(task)
-
-        # Deduplicate targets (same path might be found from multiple cache roots)
-        # Use dict for O(1) lookup instead of set iteration
-        result.targets = list({t.path: t for t in result.targets}.values())
-
         # Sort by size descending
-        result.targets.sort(key=lambda t: t.size_bytes, reverse=True)
+        result.targets.sort(key=attrgetter("size_bytes"), reverse=True)
         result.total_size = sum(t.size_bytes for t in result.targets)
 
         return result
 
     def _collect_matches(
         self,
-        path: Path,
-        matches: list[tuple[Path, BloatPattern]],
+        paths: list[Path],
+        matches: list[tuple[str, BloatPattern]],
         result: CacheScanResult,
-        depth: int = 0,
-        max_depth: int = 3,
+        on_dir: Callable[[str], None] | None = None,
     ) -> None:
         """Collect matching cache directories without calculating sizes."""
         collect_pattern_matches(
-            path, matches, result.scan_errors,
-            self._match_against_patterns, depth, max_depth
+            paths, matches, result.scan_errors, self._match_against_patterns,
+            parallel_config=self.parallel_config, on_dir=on_dir,
         )
 
-    def _match_against_patterns(self, path: Path) -> BloatPattern | None:
-        """Check if path matches any cache pattern."""
-        return match_patterns(path, self.patterns)
+    def _match_against_patterns(self, name: str, path: str) -> BloatPattern | None:
+        """Check if a directory matches any cache pattern."""
+        return self._matcher.match_entry(name, path)
@@ -2,7 +2,9 @@
 
 from __future__ import annotations
 
+import os
 import shutil
+import stat
 from pathlib import Path
 from typing import Optional
 
@@ -10,9 +12,14 @@ from rich.console import Console
 from rich.progress import BarColumn, MofNCompleteColumn, Progress, SpinnerColumn, TextColumn
 
 from bloat_hunter.core.duplicates import DuplicateGroup, KeepStrategy
-from bloat_hunter.core.scanner import BloatTarget, format_size
+from bloat_hunter.core.parallel import ParallelConfig, parallel_map
+from bloat_hunter.core.scanner import BloatTarget
+from bloat_hunter.core.sizes import format_size
 from bloat_hunter.safety.protected import is_protected_path
 
+# Paths handed to send2trash per call (each call sets up the platform backend once)
+TRASH_BATCH_SIZE = 256
+
 
 class CleanerError(Exception):
     """Error during cleanup operation."""
@@ -23,9 +30,15 @@ class CleanerError(Exception):
 class Cleaner:
     """Safely cleans up bloat targets."""
 
-    def __init__(self, console: Optional[Console] = None, use_trash: bool = True):
+    def __init__(
+        self,
+        console: Optional[Console] = None,
+        use_trash: bool = True,
+        parallel_config: ParallelConfig | None = None,
+    ):
         self.console = console or Console()
         self.use_trash = use_trash
+        self.parallel_config = parallel_config or ParallelConfig()
         self._send2trash = self._load_send2trash() if use_trash else None
 
     def _load_send2trash(self):
@@ -50,31 +63,9 @@ class Cleaner:
         Returns:
             Tuple of (success_count, failure_count)
         """
-        success_count = 0
-        failure_count = 0
-        freed_bytes = 0
-
-        with Progress(
-            SpinnerColumn(),
-            TextColumn("[progress.description]{task.description}"),
-            BarColumn(),
-            MofNCompleteColumn(),
-            console=self.console,
-        ) as progress:
-            task = progress.add_task("Cleaning up...", total=len(targets))
-
-            for target in targets:
-                progress.update(task, description=f"Deleting: {target.path.name[:40]}")
-
-                try:
-                    self._delete_target(target)
-                    success_count += 1
-                    freed_bytes += target.size_bytes
-                except Exception as e:
-                    failure_count += 1
-                    self.console.print(f"[red]Failed to delete {target.path}: {e}[/red]")
-
-                progress.advance(task)
+        success_count, failure_count, freed_bytes = self._remove_paths(
+            [(target.path, target.size_bytes) for target in targets], "Cleaning up..."
+        )
 
         # Summary
         self.console.print()
@@ -88,32 +79,6 @@ class Cleaner:
 
         return success_count, failure_count
 
-    def _delete_target(self, target: BloatTarget) -> None:
-        """Delete a single target safely."""
-        path = target.path
-
-        # Safety check
-        if is_protected_path(path):
-            raise CleanerError(f"Refusing to delete protected path: {path}")
-
-        if not path.exists():
-            return  # Already deleted
-
-        # Use trash if available, otherwise permanent delete
-        if self._send2trash:
-            try:
-                self._send2trash(str(path.absolute()))
-                return
-            except Exception:
-                # Fall back to permanent deletion
-                pass
-
-        # Permanent deletion
-        if path.is_dir():
-            shutil.rmtree(path, ignore_errors=True)
-        else:
-            path.unlink(missing_ok=True)
-
     def clean_duplicates(
         self,
         groups: list[DuplicateGroup],
@@ -138,37 +103,10 @@ class Cleaner:
         if not files_to_delete:
             return 0, 0
 
-        success_count = 0
-        failure_count = 0
-        freed_bytes = 0
-
-        with Progress(
-            SpinnerColumn(),
-            TextColumn("[progress.description]{task.description}"),
-            BarColumn(),
-            MofNCompleteColumn(),
-            console=self.console,
-        ) as progress:
-            task = progress.add_task("Cleaning duplicates...", total=len(files_to_delete))
-
-            for file_path in files_to_delete:
-                progress.update(task, description=f"Deleting: {file_path.name[:40]}")
-
-                try:
-                    # Get size before deletion for accurate reporting
-                    try:
-                        file_size = file_path.stat().st_size
-                    except OSError:
-                        file_size = 0
-
-                    self._delete_file(file_path)
-                    success_count += 1
-                    freed_bytes += file_size
-                except Exception as e:
-                    failure_count += 1
-                    self.console.print(f"[red]Failed to delete {file_path}: {e}[/red]")
-
-                progress.advance(task)
+        success_count, failure_count, freed_bytes = self._remove_paths(
+            [(file_path, _file_size(file_path)) for file_path in files_to_delete],
+            "Cleaning duplicates...",
+        )
 
         # Summary
         self.console.print()
@@ -182,23 +120,128 @@ class Cleaner:
 
         return success_count, failure_count
 
-    def _delete_file(self, path: Path) -> None:
-        """Delete a single file safely."""
-        # Safety check
-        if is_protected_path(path):
-            raise CleanerError(f"Refusing to delete protected path: {path}")
+    def _remove_paths(
+        self, items: list[tuple[Path, int]], description: str
+    ) -> tuple[int, int, int]:
+        """
+        Delete paths in bulk.
+
+        Trashed paths are handed to send2trash in batches rather than one call
+        per path; if a batch fails, its remaining paths are retried one by one.
+        Permanent deletions run in parallel.
+
+        Args:
+            items: List of (path, size_bytes) to delete
+            description: Progress bar description
+
+        Returns:
+            Tuple of (success_count, failure_count, freed_bytes)
+        """
+        success_count = 0
+        failure_count = 0
+        freed_bytes = 0
+        deletable: list[tuple[Path, int]] = []
+
+        for path, size in items:
+            # Safety check
+            if is_protected_path(path):
+                failure_count += 1
+                refusal = CleanerError(f"Refusing to delete protected path: {path}")
+                self.console.print(f"[red]Failed to delete {path}: {refusal}[/red]")
+            elif not os.path.exists(path):
+                success_count += 1  # Already deleted
+                freed_bytes += size
+            else:
+                deletable.append((path, size))
+
+        with Progress(
+            SpinnerColumn(),
+            TextColumn("[progress.description]{task.description}"),
+            BarColumn(),
+            MofNCompleteColumn(),
+            console=self.console,
+        ) as progress:
+            task = progress.add_task(description, total=len(deletable))
 
-        if not path.exists():
-            return  # Already deleted
+            if self._send2trash:
+                for start in range(0, len(deletable), TRASH_BATCH_SIZE):
+                    batch = deletable[start : start + TRASH_BATCH_SIZE]
+                    progress.update(
+                        task, description=f"Trashing: {os.path.basename(batch[0][0])[:40]}"
+                    )
 
+                    try:
+                        self._send2trash([os.path.abspath(path) for path, _ in batch])
+                        success_count += len(batch)
+                        freed_bytes += sum(size for _, size in batch)
+                    except Exception:
+                        # Part of the batch may already be gone; retry the rest singly
+                        for path, size in batch:
+                            try:
+                                self._delete_path(path)
+                                success_count += 1
+                                freed_bytes += size
+                            except Exception as e:
+                                failure_count += 1
+                                self.console.print(f"[red]Failed to delete {path}: {e}[/red]")
+
+                    progress.advance(task, len(batch))
+            else:
+                sizes = dict(deletable)
+                for path, _, error in parallel_map(
+                    _remove_permanently, list(sizes), self.parallel_config
+                ):
+                    progress.update(
+                        task, description=f"Deleting: {os.path.basename(path)[:40]}"
+                    )
+
+                    if error is None:
+                        success_count += 1
+                        freed_bytes += sizes[path]
+                    else:
+                        failure_count += 1
+                        self.console.print(f"[red]Failed to delete {path}: {error}[/red]")
+
+                    progress.advance(task)
+
+        return success_count, failure_count, freed_bytes
+
+    def _delete_path(self, path: Path) -> None:
+        """Delete a single path, preferring the trash when available.
+
+        A path that is already gone makes send2trash fail and falls through to
+        _remove_permanently, which treats it as deleted.
+        """
         # Use trash if available, otherwise permanent delete
         if self._send2trash:
             try:
-                self._send2trash(str(path.absolute()))
+                self._send2trash(os.path.abspath(path))
                 return
             except Exception:
                 # Fall back to permanent deletion
                 pass
 
-        # Permanent deletion
-        path.unlink(missing_ok=True)
+        _remove_permanently(path)
+
+
+def _file_size(path: Path) -> int:
+    """Return a file's size before deletion, or 0 if it cannot be read."""
+    try:
+        return os.stat(path).st_size
+    except OSError:
+        return 0
+
+
+def _remove_permanently(path: Path) -> None:
+    """Permanently delete a file or directory tree.
+
+    A symlink is removed itself, never followed into its target. Paths that
+    are already gone, or vanish midway, count as deleted.
+    """
+    try:
+        if stat.S_ISDIR(os.lstat(path).st_mode):
+            shutil.rmtree(path, ignore_errors=True)
+        else:
+            os.unlink(path)
+    except FileNotFoundError:
+        pass  # Already deleted
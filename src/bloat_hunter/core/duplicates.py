@@ -2,6 +2,8 @@
 
 from __future__ import annotations
 
+import functools
+import mmap
 import os
 from collections import defaultdict
 from collections.abc import Callable
@@ -12,30 +14,39 @@ from typing import TYPE_CHECKING, Literal, Optional, Protocol
 from rich.console import Console
 from rich.progress import BarColumn, Progress, SpinnerColumn, TaskProgressColumn, TextColumn
 
-from bloat_hunter.core.parallel import ParallelConfig, parallel_map
-from bloat_hunter.core.scanner import format_size
-from bloat_hunter.safety.protected import is_protected_path
+from bloat_hunter.core.parallel import ParallelConfig, parallel_map, parallel_walk
+from bloat_hunter.core.sizes import format_size
+from bloat_hunter.safety.protected import is_protected_scan_path
 
 if TYPE_CHECKING:
     from rich.progress import TaskID
 
+    from bloat_hunter.core.hash_cache import HashCache
+
 
 class Hasher(Protocol):
     """Protocol for hash objects (xxhash or hashlib)."""
 
-    def update(self, data: bytes) -> None: ...
+    def update(self, data: bytes | mmap.mmap) -> None: ...
     def hexdigest(self) -> str: ...
 
 # Default minimum file size (1 MB)
 DEFAULT_MIN_SIZE = 1024 * 1024
 
-# Chunk size for reading files (64KB)
-CHUNK_SIZE = 65536
+# Chunk size for reading files (1MB)
+CHUNK_SIZE = 1024 * 1024
+
+# Bytes read from each end of a candidate before committing to a full hash (64KB);
+# files up to twice this size are read whole, so their partial hash is final
+PARTIAL_SIZE = 64 * 1024
+
+# Files at least this large are memory-mapped and hashed in one call (4MB)
+MMAP_THRESHOLD = 4 * 1024 * 1024
 
 KeepStrategy = Literal["first", "shortest", "oldest", "newest"]
 
 
-@dataclass
+@dataclass(slots=True)
 class DuplicateFile:
     """A single file that is part of a duplicate group."""
 
@@ -49,7 +60,7 @@ class DuplicateFile:
         return format_size(self.size_bytes)
 
 
-@dataclass
+@dataclass(slots=True)
 class DuplicateGroup:
     """A group of files with identical content."""
 
@@ -79,24 +90,34 @@ class DuplicateGroup:
 
     def get_keep_file(self, strategy: KeepStrategy) -> DuplicateFile:
         """Determine which file to keep based on strategy."""
-        if not self.files:
+        return self.files[self._keep_index(strategy)]
+
+    def get_duplicates_to_remove(self, strategy: KeepStrategy) -> list[DuplicateFile]:
+        """Get list of duplicate files to remove (all except the one to keep)."""
+        index = self._keep_index(strategy)
+        return self.files[:index] + self.files[index + 1 :]
+
+    def _keep_index(self, strategy: KeepStrategy) -> int:
+        """Index of the file to keep; ties go to the earliest file."""
+        files = self.files
+        if not files:
             raise ValueError("Cannot get keep file from empty DuplicateGroup")
+
+        indices = range(len(files))
         if strategy == "shortest":
-            return min(self.files, key=lambda f: len(str(f.path)))
+            lengths = [len(str(f.path)) for f in files]
+            return min(indices, key=lengths.__getitem__)
         elif strategy == "oldest":
-            return min(self.files, key=lambda f: f.mtime)
+            mtimes = [f.mtime for f in files]
+            return min(indices, key=mtimes.__getitem__)
         elif strategy == "newest":
-            return max(self.files, key=lambda f: f.mtime)
+            mtimes = [f.mtime for f in files]
+            return max(indices, key=mtimes.__getitem__)
         else:  # "first" or default
-            return self.files[0]
-
-    def get_duplicates_to_remove(self, strategy: KeepStrategy) -> list[DuplicateFile]:
-        """Get list of duplicate files to remove (all except the one to keep)."""
-        keep = self.get_keep_file(strategy)
-        return [f for f in self.files if f.path != keep.path]
+            return 0
 
 
-@dataclass
+@dataclass(slots=True)
 class DuplicateResult:
     """Results from a duplicate file scan."""
 
@@ -117,26 +138,48 @@ class DuplicateResult:
         return sum(g.duplicate_count for g in self.groups)
 
 
-def _get_hasher() -> Callable[[], Hasher]:
-    """Get the best available hash function."""
+def _get_hasher() -> tuple[str, Callable[[], Hasher]]:
+    """
+    Get the best available hash function.
+
+    Prefers xxh3_128, then multi-threaded BLAKE3, then the stdlib's blake2b.
+
+    Returns:
+        Tuple of (algorithm name, hasher factory)
+    """
     try:
         import xxhash
 
-        return lambda: xxhash.xxh3_64()
+        return "xxh3_128", lambda: xxhash.xxh3_128()
+    except ImportError:
+        pass
+
+    try:
+        import blake3  # type: ignore[import-not-found]
+
+        # Large inputs (mmapped files) are split across threads in native code
+        return "blake3", lambda: blake3.blake3(max_threads=blake3.blake3.AUTO)
     except ImportError:
         import hashlib
 
-        return lambda: hashlib.blake2b(digest_size=8)
+        return "blake2b_128", lambda: hashlib.blake2b(digest_size=16)
+
 
+# Ask the kernel for aggressive readahead on chunked full reads (not on Windows/macOS)
+_FADVISE_SEQUENTIAL = hasattr(os, "posix_fadvise")
 
 # Cache hasher factory at module level to avoid re-checking imports on each call
-_hasher_factory: Callable[[], Hasher] = _get_hasher()
+HASH_ALGORITHM, _hasher_factory = _get_hasher()
 
 
-def hash_file(path: Path) -> Optional[str]:
+def hash_file(path: Path | str) -> Optional[str]:
     """
     Hash a file's contents.
 
+    Large files are memory-mapped so the hasher reads straight from the page
+    cache instead of copying each chunk into a new bytes object. Either way
+    the kernel is told the file is read sequentially, so it reads ahead.
+
     Args:
         path: Path to the file to hash
 
@@ -147,14 +190,62 @@ def hash_file(path: Path) -> Optional[str]:
 
     try:
         with open(path, "rb") as f:
-            while chunk := f.read(CHUNK_SIZE):
-                hasher.update(chunk)
+            if os.fstat(f.fileno()).st_size >= MMAP_THRESHOLD:
+                with mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as mapped:
+                    if hasattr(mapped, "madvise"):
+                        mapped.madvise(mmap.MADV_SEQUENTIAL)
+                    hasher.update(mapped)
+            else:
+                if _FADVISE_SEQUENTIAL:
+                    os.posix_fadvise(f.fileno(), 0, 0, os.POSIX_FADV_SEQUENTIAL)
+                while chunk := f.read(CHUNK_SIZE):
+                    hasher.update(chunk)
+        return hasher.hexdigest()
+    except (PermissionError, OSError, ValueError):
+        return None
+
+
+def hash_file_partial(path: Path | str, size: int, length: int = PARTIAL_SIZE) -> str | None:
+    """
+    Hash the first and last bytes of a file.
+
+    Same-size files that differ usually do so near one end (headers,
+    trailers, appended data), so this splits most of them without a full
+    read. A file of at most 2 * length bytes is hashed whole, giving the
+    same digest as hash_file.
+
+    Args:
+        path: Path to the file to hash
+        size: Size of the file in bytes
+        length: Number of bytes to hash from each end
+
+    Returns:
+        Hex digest of both ends, or None if file cannot be read.
+    """
+    hasher = _hasher_factory()
+
+    try:
+        with open(path, "rb") as f:
+            if size <= 2 * length:
+                hasher.update(f.read(2 * length))
+            else:
+                hasher.update(f.read(length))
+                f.seek(size - length)
+                hasher.update(f.read(length))
         return hasher.hexdigest()
     except (PermissionError, OSError):
         return None
 
 
-def hash_candidate(item: tuple[int, Path]) -> tuple[int, Path, str | None, float]:
+def _file_mtime(path: str) -> float:
+    """Return a file's mtime, or 0.0 if it cannot be read."""
+    try:
+        return os.stat(path).st_mtime
+    except OSError:
+        return 0.0
+
+
+def hash_candidate(item: tuple[int, str]) -> tuple[int, str, str | None, float]:
     """
     Hash a single file and return metadata.
 
@@ -165,12 +256,73 @@ def hash_candidate(item: tuple[int, Path]) -> tuple[int, Path, str | None, float
         Tuple of (size_bytes, path, file_hash, mtime)
     """
     size, path = item
-    file_hash = hash_file(path)
+    return (size, path, hash_file(path), _file_mtime(path))
+
+
+def hash_candidate_partial(item: tuple[int, str]) -> tuple[int, str, str | None, float]:
+    """
+    Hash both PARTIAL_SIZE ends of a file and return metadata.
+
+    Args:
+        item: Tuple of (size_bytes, path) to hash
+
+    Returns:
+        Tuple of (size_bytes, path, partial_hash, mtime)
+    """
+    size, path = item
+    return (size, path, hash_file_partial(path, size), _file_mtime(path))
+
+
+def hash_candidate_partial_cached(
+    item: tuple[int, str], cache: HashCache
+) -> tuple[int, str, str | None, float]:
+    """
+    Like hash_candidate_partial, but reuse the cached hash of unchanged files.
+
+    Args:
+        item: Tuple of (size_bytes, path) to hash
+        cache: Hash cache to consult and update
+
+    Returns:
+        Tuple of (size_bytes, path, partial_hash, mtime)
+    """
+    return _hash_candidate_cached(item, cache, full=False)
+
+
+def hash_candidate_cached(
+    item: tuple[int, str], cache: HashCache
+) -> tuple[int, str, str | None, float]:
+    """
+    Like hash_candidate, but reuse the cached hash of unchanged files.
+
+    Args:
+        item: Tuple of (size_bytes, path) to hash
+        cache: Hash cache to consult and update
+
+    Returns:
+        Tuple of (size_bytes, path, file_hash, mtime)
+    """
+    return _hash_candidate_cached(item, cache, full=True)
+
+
+def _hash_candidate_cached(
+    item: tuple[int, str], cache: HashCache, full: bool
+) -> tuple[int, str, str | None, float]:
+    """Look up a candidate's partial or full hash, computing and caching it on a miss."""
+    size, path = item
+
     try:
-        mtime = path.stat().st_mtime
+        st = os.stat(path)
     except OSError:
-        mtime = 0.0
-    return (size, path, file_hash, mtime)
+        return (size, path, None, 0.0)
+
+    file_hash = cache.get(path, st, full=full)
+    if file_hash is None:
+        file_hash = hash_file(path) if full else hash_file_partial(path, st.st_size)
+        if file_hash is not None:
+            cache.put(path, st, file_hash, full=full)
+
+    return (size, path, file_hash, st.st_mtime)
 
 
 class DuplicateScanner:
@@ -181,18 +333,25 @@ class DuplicateScanner:
         console: Optional[Console] = None,
         min_size: int = DEFAULT_MIN_SIZE,
         parallel_config: Optional[ParallelConfig] = None,
+        hash_cache: HashCache | None = None,
     ):
         self.console = console or Console()
         self.min_size = min_size
         self.parallel_config = parallel_config or ParallelConfig()
+        self.hash_cache = hash_cache
 
     def scan(self, root: Path) -> DuplicateResult:
         """
         Scan a directory for duplicate files.
 
-        Uses two-phase approach:
-        1. Group files by size (fast)
-        2. Hash only same-size files (expensive but fewer)
+        Narrows candidates in stages, so full reads are only spent on files
+        that are still plausible duplicates:
+        1. Group files by size (metadata only)
+        2. Hash the first and last PARTIAL_SIZE bytes of same-size files
+           (reusing hash_cache entries for unchanged files when a cache is
+           given)
+        3. Fully hash files whose size and partial hash both collide (again
+           reusing hash_cache entries)
 
         Args:
             root: Directory to scan
@@ -210,25 +369,92 @@ class DuplicateScanner:
         ) as progress:
             task = progress.add_task("Scanning files by size...", total=None)
 
-            size_groups: dict[int, list[Path]] = defaultdict(list)
+            size_groups: dict[int, list[str]] = defaultdict(list)
             self._collect_files_by_size(root, size_groups, result, progress, task)
 
-        # Filter to only sizes with 2+ files
-        candidate_groups = {
-            size: paths for size, paths in size_groups.items() if len(paths) >= 2
-        }
+        # Flatten sizes with 2+ files into (size, path) tuples for parallel processing
+        candidates: list[tuple[int, str]] = [
+            (size, path)
+            for size, paths in size_groups.items()
+            if len(paths) >= 2
+            for path in paths
+        ]
 
-        if not candidate_groups:
+        if not candidates:
             return result
 
-        # Phase 2: Hash files with matching sizes (parallel)
-        total_candidates = sum(len(paths) for paths in candidate_groups.values())
+        # Phase 2: Split size groups by a hash of each file's two ends (parallel)
+        partial_func: Callable[[tuple[int, str]], tuple[int, str, str | None, float]] = (
+            hash_candidate_partial
+            if self.hash_cache is None
+            else functools.partial(hash_candidate_partial_cached, cache=self.hash_cache)
+        )
+        partial_groups = self._group_by_hash(partial_func, candidates, "Probing candidates...")
+
+        hash_groups: dict[tuple[int, str], list[tuple[str, float]]] = {}
+        full_candidates: list[tuple[int, str]] = []
+
+        for (size, partial_hash), files in partial_groups.items():
+            if len(files) < 2:
+                continue
+            if size <= 2 * PARTIAL_SIZE:
+                # The partial hash covered the whole file, so it is final
+                hash_groups[(size, partial_hash)] = files
+            else:
+                full_candidates.extend((size, path) for path, _ in files)
+
+        # Phase 3: Fully hash files whose size and partial hash both match (parallel)
+        if full_candidates:
+            full_func: Callable[[tuple[int, str]], tuple[int, str, str | None, float]] = (
+                hash_candidate
+                if self.hash_cache is None
+                else functools.partial(hash_candidate_cached, cache=self.hash_cache)
+            )
+            hash_groups.update(
+                self._group_by_hash(full_func, full_candidates, "Hashing candidates...")
+            )
+
+        # Filter to only groups with actual duplicates; only their files get a Path
+        result.groups = [
+            DuplicateGroup(
+                hash_value=file_hash,
+                size_bytes=size,
+                files=[
+                    DuplicateFile(path=Path(path), size_bytes=size, mtime=mtime)
+                    for path, mtime in files
+                ],
+            )
+            for (size, file_hash), files in hash_groups.items()
+            if len(files) >= 2
+        ]
+
+        # Sort by wasted space descending
+        result.groups.sort(key=lambda g: g.wasted_bytes, reverse=True)
+
+        # Calculate totals
+        result.total_wasted = sum(g.wasted_bytes for g in result.groups)
+
+        return result
+
+    def _group_by_hash(
+        self,
+        hash_func: Callable[[tuple[int, str]], tuple[int, str, str | None, float]],
+        candidates: list[tuple[int, str]],
+        description: str,
+    ) -> dict[tuple[int, str], list[tuple[str, float]]]:
+        """
+        Hash candidates in parallel and group them by (size, hash).
 
-        # Flatten candidate groups into list of (size, path) tuples for parallel processing
-        candidates: list[tuple[int, Path]] = []
-        for size, paths in candidate_groups.items():
-            for path in paths:
-                candidates.append((size, path))
+        Args:
+            hash_func: Function returning (size, path, hash, mtime) for a candidate
+            candidates: List of (size_bytes, path) tuples to hash
+            description: Progress bar description
+
+        Returns:
+            Dict mapping (size, hash) to the (path, mtime) of files sharing it.
+            Unreadable files are dropped.
+        """
+        groups: dict[tuple[int, str], list[tuple[str, float]]] = defaultdict(list)
 
         with Progress(
             SpinnerColumn(),
@@ -237,98 +463,74 @@ class DuplicateScanner:
             TaskProgressColumn(),
             console=self.console,
         ) as progress:
-            task = progress.add_task("Hashing candidates...", total=total_candidates)
-
-            hash_groups: dict[str, DuplicateGroup] = {}
+            task = progress.add_task(description, total=len(candidates))
 
             for item, hash_result, error in parallel_map(
-                hash_candidate, candidates, self.parallel_config
+                hash_func, candidates, self.parallel_config
             ):
                 size, path = item
-                progress.update(task, description=f"Hashing: {path.name[:40]}")
-
-                if error is not None or hash_result is None:
-                    progress.advance(task)
-                    continue
-
-                _, _, file_hash, mtime = hash_result
-                if file_hash is None:
-                    progress.advance(task)
-                    continue
-
-                # Create composite key: size + hash
-                key = f"{size}:{file_hash}"
+                progress.update(task, description=f"Hashing: {os.path.basename(path)[:40]}")
 
-                if key not in hash_groups:
-                    hash_groups[key] = DuplicateGroup(
-                        hash_value=file_hash,
-                        size_bytes=size,
-                    )
-
-                hash_groups[key].files.append(
-                    DuplicateFile(
-                        path=path,
-                        size_bytes=size,
-                        mtime=mtime,
-                    )
-                )
+                if error is None and hash_result is not None:
+                    _, _, file_hash, mtime = hash_result
+                    if file_hash is not None:
+                        groups[(size, file_hash)].append((path, mtime))
 
                 progress.advance(task)
 
-        # Filter to only groups with actual duplicates
-        result.groups = [group for group in hash_groups.values() if len(group.files) >= 2]
-
-        # Sort by wasted space descending
-        result.groups.sort(key=lambda g: g.wasted_bytes, reverse=True)
-
-        # Calculate totals
-        result.total_wasted = sum(g.wasted_bytes for g in result.groups)
-
-        return result
+        return groups
 
     def _collect_files_by_size(
         self,
         path: Path,
-        size_groups: dict[int, list[Path]],
+        size_groups: dict[int, list[str]],
         result: DuplicateResult,
         progress: Progress,
         task_id: TaskID,
     ) -> None:
-        """Recursively collect files grouped by size."""
-        if is_protected_path(path, for_scanning=True):
-            return
-
-        try:
-            with os.scandir(path) as entries:
-                for entry in entries:
-                    try:
-                        if entry.is_symlink():
-                            continue
-
-                        if entry.is_file(follow_symlinks=False):
-                            stat = entry.stat(follow_symlinks=False)
-                            size = stat.st_size
-
-                            # Skip files below minimum size
-                            if size >= self.min_size:
-                                size_groups[size].append(Path(entry.path))
-                                result.files_scanned += 1
-
-                            progress.update(
-                                task_id, description=f"Scanning: {entry.name[:40]}"
-                            )
-
-                        elif entry.is_dir(follow_symlinks=False):
-                            self._collect_files_by_size(
-                                Path(entry.path),
-                                size_groups,
-                                result,
-                                progress,
-                                task_id,
-                            )
-
-                    except (PermissionError, OSError):
+        """Collect files grouped by size, walking directories concurrently."""
+        for dir_path, files, error in parallel_walk(
+            self._scan_dir, [str(path)], self.parallel_config
+        ):
+            if error is not None:
+                result.scan_errors.append(f"{dir_path}: {error}")
+                continue
+            if not files:
+                continue
+
+            for size, file_path in files:
+                size_groups[size].append(file_path)
+            result.files_scanned += len(files)
+
+            progress.update(
+                task_id, description=f"Scanning: {os.path.basename(files[-1][1])[:40]}"
+            )
+
+    def _scan_dir(self, dir_path: str) -> tuple[list[str], list[tuple[int, str]]]:
+        """Scan one directory, returning subdirectories and (size, path) of files."""
+        subdirs: list[str] = []
+        files: list[tuple[int, str]] = []
+
+        if is_protected_scan_path(dir_path):
+            return subdirs, files
+
+        with os.scandir(dir_path) as entries:
+            for entry in entries:
+                try:
+                    if entry.is_symlink():
                         continue
 
-        except (PermissionError, OSError) as e:
-            result.scan_errors.append(f"{path}: {e}")
+                    if entry.is_file(follow_symlinks=False):
+                        size = entry.stat(follow_symlinks=False).st_size
+
+                        # Skip files below minimum size
+                        if size >= self.min_size:
+                            files.append((size, entry.path))
+
+                    elif entry.is_dir(follow_symlinks=False):
+                        subdirs.append(entry.path)
+
+                except (PermissionError, OSError):
+                    continue
+
+        return subdirs, files
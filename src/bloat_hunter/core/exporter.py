@@ -4,7 +4,9 @@ from __future__ import annotations
 
 import csv
 import json
+from collections.abc import Callable
 from datetime import datetime, timezone
+from functools import partial
 from pathlib import Path
 from typing import TYPE_CHECKING, Any, Literal, TypeAlias
 
@@ -14,8 +16,21 @@ if TYPE_CHECKING:
     from bloat_hunter.core.package_scanner import PackageScanResult
     from bloat_hunter.core.scanner import BloatTarget, ScanResult
 
+# Prefer orjson for JSON export when installed (pip install bloat-hunter[speedups]).
+# It only supports 2-space indentation and always writes UTF-8.
+_orjson_dumps: Callable[[Any], bytes] | None
+try:
+    import orjson
+
+    _orjson_dumps = partial(orjson.dumps, option=orjson.OPT_INDENT_2)
+except ImportError:
+    _orjson_dumps = None
+
 ExportFormat = Literal["json", "csv"]
 
+# Write buffer for CSV exports (1MB)
+CSV_BUFFER_SIZE = 1024 * 1024
+
 # Type alias for any scan result type
 AnyResult: TypeAlias = "ScanResult | DuplicateResult | CacheScanResult | PackageScanResult"
 
@@ -167,6 +182,11 @@ def export_json(
         indent: JSON indentation level (default: 2)
     """
     data = result_to_dict(result)
+
+    if _orjson_dumps is not None and indent == 2:
+        output_path.write_bytes(_orjson_dumps(data))
+        return
+
     with open(output_path, "w", encoding="utf-8") as f:
         json.dump(data, f, indent=indent, ensure_ascii=False)
 
@@ -207,11 +227,22 @@ def _export_targets_csv(
         "file_count",
     ]
 
-    with open(output_path, "w", encoding="utf-8", newline="") as f:
-        writer = csv.DictWriter(f, fieldnames=fieldnames)
-        writer.writeheader()
-        for target in result.targets:
-            writer.writerow(_target_to_dict(target))
+    with open(
+        output_path, "w", encoding="utf-8", newline="", buffering=CSV_BUFFER_SIZE
+    ) as f:
+        writer = csv.writer(f)
+        writer.writerow(fieldnames)
+        writer.writerows(
+            (
+                str(t.path),
+                t.category,
+                t.pattern.name,
+                t.size_bytes,
+                t.size_human,
+                t.file_count,
+            )
+            for t in result.targets
+        )
 
 
 def _export_duplicates_csv(result: DuplicateResult, output_path: Path) -> None:
@@ -225,19 +256,20 @@ def _export_duplicates_csv(result: DuplicateResult, output_path: Path) -> None:
         "file_mtime",
     ]
 
-    with open(output_path, "w", encoding="utf-8", newline="") as f:
-        writer = csv.DictWriter(f, fieldnames=fieldnames)
-        writer.writeheader()
+    with open(
+        output_path, "w", encoding="utf-8", newline="", buffering=CSV_BUFFER_SIZE
+    ) as f:
+        writer = csv.writer(f)
+        writer.writerow(fieldnames)
         for group in result.groups:
-            for file in group.files:
-                writer.writerow({
-                    "group_hash": group.hash_value,
-                    "group_size_bytes": group.size_bytes,
-                    "group_wasted_bytes": group.wasted_bytes,
-                    "duplicate_count": group.duplicate_count,
-                    "file_path": str(file.path),
-                    "file_mtime": file.mtime,
-                })
+            # Group columns are the same on every row of the group
+            head = (
+                group.hash_value,
+                group.size_bytes,
+                group.wasted_bytes,
+                group.duplicate_count,
+            )
+            writer.writerows((*head, str(file.path), file.mtime) for file in group.files)
 
 
 def export_result(
@@ -0,0 +1,200 @@
+"""Persistent cache of file hashes for duplicate detection."""
+
+from __future__ import annotations
+
+import dbm
+import os
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
+from pathlib import Path
+from types import TracebackType
+
+from bloat_hunter.config import get_cache_dir
+from bloat_hunter.core.duplicates import HASH_ALGORITHM
+
+# Bump when what is hashed per file changes, so old entries are never reused
+_CACHE_VERSION = 4
+
+# Entries not read or written for this many days are dropped on close()
+HASH_CACHE_MAX_AGE_DAYS = 30
+
+# Records the day of the last prune, so the store is walked at most once a
+# day. Paths cannot contain NUL, so no file's key can collide with it.
+_PRUNED_KEY = b"\0pruned"
+
+
+def get_hash_cache_path() -> Path:
+    """
+    Get the default location of the hash cache.
+
+    Each hash algorithm gets its own cache, so installing or removing an
+    optional hasher never compares digests from two different algorithms.
+    """
+    return get_cache_dir() / f"dedup-v{_CACHE_VERSION}-{HASH_ALGORITHM}"
+
+
+def _key(path: Path | str, full: bool) -> bytes:
+    """
+    Build the database key for a path.
+
+    A file can have two entries: its partial hash under the plain path, and
+    its full hash under the same path prefixed with b"full\\0". Both are
+    validated and expired the same way.
+    """
+    key = os.fsencode(path)
+    return b"full\0" + key if full else key
+
+
+def _today() -> int:
+    """Get the current day number, the granularity at which entry use is tracked."""
+    return int(time.time() // 86400)
+
+
+def _signature(st: os.stat_result) -> str:
+    """Identify one version of one file by its device, inode, size, mtime and ctime."""
+    return f"{st.st_dev}:{st.st_ino}:{st.st_size}:{st.st_mtime_ns}:{st.st_ctime_ns}"
+
+
+class HashCache:
+    """
+    Maps file paths to the partial and full hashes recorded on previous runs.
+
+    Entries are keyed by path and store the device, inode, size, mtime_ns and
+    ctime_ns the hash was computed for, so a file that has changed since simply
+    misses. The ctime cannot be set from user space, so an in-place edit whose
+    mtime was restored (rsync -t, cp -p, tar) still invalidates. Lookups are
+    safe to call from worker threads; new hashes are buffered in memory and
+    written back on close().
+
+    Every database call runs on one dedicated thread, which opens and closes
+    the handle. Some dbm backends only work on the thread that opened them
+    (dbm.sqlite3, the default from Python 3.13), and others cannot be opened
+    twice (dbm.gnu), so neither sharing nor a handle per thread would do.
+
+    Each entry also records the day it was last read or written. The first
+    close() of each day drops entries unused for HASH_CACHE_MAX_AGE_DAYS, so
+    hashes of deleted, moved or no longer scanned files do not pile up.
+    """
+
+    def __init__(self, path: Path | None = None):
+        self.path = path or get_hash_cache_path()
+        self._today = _today()
+        self._lock = threading.Lock()
+        self._pending: dict[bytes, bytes] = {}
+        self._db_thread = ThreadPoolExecutor(max_workers=1, thread_name_prefix="hash-cache")
+        self._db = self._db_thread.submit(self._open).result()
+        if self._db is None:
+            self._db_thread.shutdown()
+
+    def _open(self) -> dbm._Database | None:
+        """Open the backing database, or return None if it is unusable."""
+        try:
+            self.path.parent.mkdir(parents=True, exist_ok=True)
+            return dbm.open(str(self.path), "c")
+        except dbm.error:
+            return None
+
+    def _read(self, key: bytes) -> bytes | None:
+        """Fetch a raw entry; runs on the database thread."""
+        if self._db is None:
+            return None
+        try:
+            return self._db.get(key)
+        except dbm.error:
+            return None
+
+    def get(self, path: Path | str, st: os.stat_result, full: bool = False) -> str | None:
+        """
+        Look up the cached hash for a file.
+
+        Args:
+            path: File path
+            st: Current stat result of the file
+            full: Look up the full-content hash instead of the partial one
+
+        Returns:
+            The cached hash if the file is unchanged, otherwise None.
+        """
+        if self._db is None:
+            return None
+
+        value = self._db_thread.submit(self._read, _key(path, full)).result()
+        if value is None:
+            return None
+
+        try:
+            last_used, rest = value.decode("ascii").split(":", 1)
+            signature, file_hash = rest.rsplit(":", 1)
+        except (UnicodeDecodeError, ValueError):
+            return None
+        if signature != _signature(st):
+            return None
+        if last_used != str(self._today):
+            self.put(path, st, file_hash, full=full)  # Refresh the last-used day
+        return file_hash
+
+    def put(
+        self, path: Path | str, st: os.stat_result, file_hash: str, full: bool = False
+    ) -> None:
+        """Record a file's partial (or full) hash, to be written on close()."""
+        with self._lock:
+            self._pending[_key(path, full)] = (
+                f"{self._today}:{_signature(st)}:{file_hash}".encode("ascii")
+            )
+
+    def _prune(self) -> None:
+        """Delete entries last used more than HASH_CACHE_MAX_AGE_DAYS ago, once a day."""
+        assert self._db is not None
+        today = str(self._today).encode("ascii")
+        if self._db.get(_PRUNED_KEY) == today:
+            return
+
+        oldest = self._today - HASH_CACHE_MAX_AGE_DAYS
+        stale = []
+        for key in self._db.keys():
+            try:
+                last_used = int(self._db[key].split(b":", 1)[0])
+            except ValueError:
+                last_used = -1  # Unreadable entry, drop it
+            if last_used < oldest:
+                stale.append(key)
+        for key in stale:
+            del self._db[key]
+        self._db[_PRUNED_KEY] = today
+
+    def _flush(self, pending: dict[bytes, bytes]) -> None:
+        """Write pending entries, prune and close; runs on the database thread."""
+        assert self._db is not None
+        try:
+            for key, value in pending.items():
+                self._db[key] = value
+            self._prune()
+        except dbm.error:
+            pass
+        finally:
+            self._db.close()
+            self._db = None
+
+    def close(self) -> None:
+        """Flush new entries, drop expired ones and close the backing database."""
+        if self._db is None:
+            return
+
+        with self._lock:
+            pending, self._pending = self._pending, {}
+        try:
+            self._db_thread.submit(self._flush, pending).result()
+        finally:
+            self._db_thread.shutdown()
+
+    def __enter__(self) -> HashCache:
+        return self
+
+    def __exit__(
+        self,
+        exc_type: type[BaseException] | None,
+        exc: BaseException | None,
+        tb: TracebackType | None,
+    ) -> None:
+        self.close()
@@ -3,27 +3,23 @@
 from __future__ import annotations
 
 import logging
+import os
+from collections.abc import Callable
 from dataclasses import dataclass, field
 from pathlib import Path
 
 from rich.console import Console
-from rich.progress import (
-    BarColumn,
-    Progress,
-    SpinnerColumn,
-    TaskProgressColumn,
-    TextColumn,
-)
 
 from bloat_hunter.core.parallel import ParallelConfig, parallel_map
 from bloat_hunter.core.scanner import (
     BloatTarget,
     calc_target,
     collect_pattern_matches,
-    format_size,
-    match_patterns,
+    scan_progress,
+    sizing_reporter,
 )
-from bloat_hunter.patterns.base import BloatPattern
+from bloat_hunter.core.sizes import format_size
+from bloat_hunter.patterns.base import BloatPattern, PatternMatcher
 from bloat_hunter.patterns.browser_cache import PACKAGE_MANAGER_PATTERNS
 from bloat_hunter.platform.detect import (
     PlatformInfo,
@@ -140,6 +136,7 @@ class PackageScanner:
             "bundler": config.bundler,
         }
         self.patterns = self._filter_patterns()
+        self._matcher = PatternMatcher(self.patterns)
         self.parallel_config = parallel_config or ParallelConfig()
 
     def _filter_patterns(self) -> list[BloatPattern]:
@@ -171,58 +168,34 @@ class PackageScanner:
     ) -> None:
         """Scan directories and collect targets with progress display."""
         # Phase 1: Collect all matching paths
-        matches: list[tuple[Path, BloatPattern]] = []
-
-        with Progress(
-            SpinnerColumn(),
-            TextColumn("[progress.description]{task.description}"),
-            BarColumn(),
-            TaskProgressColumn(),
-            console=self.console,
-        ) as progress:
-            task = progress.add_task(
-                "Scanning package caches...", total=len(paths_to_scan)
-            )
+        matches: list[tuple[str, BloatPattern]] = []
 
-            for cache_path in paths_to_scan:
-                progress.update(task, description=f"Scanning: {cache_path.name}")
+        with scan_progress(self.console) as progress:
+            task = progress.add_task("Scanning package caches...", total=None)
 
-                try:
-                    self._collect_matches(cache_path, matches, result, depth=0)
-                except (PermissionError, OSError) as e:
-                    result.scan_errors.append(f"{cache_path}: {e}")
+            def on_dir(dir_path: str) -> None:
+                progress.update(task, description=f"Scanning: {os.path.basename(dir_path)[:40]}")
 
-                progress.advance(task)
+            self._collect_matches(paths_to_scan, matches, result, on_dir)
 
-        if not matches:
-            return
+            if not matches:
+                return
 
-        # Phase 2: Calculate sizes in parallel
-        with Progress(
-            SpinnerColumn(),
-            TextColumn("[progress.description]{task.description}"),
-            BarColumn(),
-            TaskProgressColumn(),
-            console=self.console,
-        ) as progress:
+            # Phase 2: Calculate sizes in parallel
+            progress.update(task, visible=False)
             task = progress.add_task("Calculating sizes...", total=len(matches))
+            report = sizing_reporter(progress, task, len(matches))
 
             for item, target, error in parallel_map(
                 calc_target, matches, self.parallel_config
             ):
-                path, _ = item
-                progress.update(task, description=f"Sizing: {path.name[:40]}")
+                report(item[0])
 
                 if error is None and target is not None:
                     result.targets.append(target)
 
-                progress.advance(task)
-
     def _aggregate_stats(self, result: PackageScanResult) -> None:
-        """Deduplicate targets and aggregate per-manager statistics."""
-        # Deduplicate targets
-        result.targets = list({t.path: t for t in result.targets}.values())
-
+        """Aggregate per-manager statistics."""
         # Sort by size descending
         result.targets.sort(key=lambda t: t.size_bytes, reverse=True)
         result.total_size = sum(t.size_bytes for t in result.targets)
@@ -276,26 +249,25 @@ class PackageScanner:
 
     def _collect_matches(
         self,
-        path: Path,
-        matches: list[tuple[Path, BloatPattern]],
+        paths: list[Path],
+        matches: list[tuple[str, BloatPattern]],
         result: PackageScanResult,
-        depth: int = 0,
-        max_depth: int = 3,
+        on_dir: Callable[[str], None] | None = None,
     ) -> None:
         """Collect matching package manager cache directories."""
         collect_pattern_matches(
-            path, matches, result.scan_errors,
-            self._match_against_patterns, depth, max_depth
+            paths, matches, result.scan_errors, self._match_against_patterns,
+            parallel_config=self.parallel_config, on_dir=on_dir,
         )
 
-    def _match_against_patterns(self, path: Path) -> BloatPattern | None:
-        """Check if path matches any package manager cache pattern."""
+    def _match_against_patterns(self, name: str, path: str) -> BloatPattern | None:
+        """Check if a directory matches any package manager cache pattern."""
         # Special case for Maven: "repository" is too generic, so validate parent
         if (
-            self._include.get("maven", True)
-            and path.name == "repository"
-            and path.parent.name == ".m2"
+            name == "repository"
+            and self._include.get("maven", True)
+            and os.path.basename(os.path.dirname(path)) == ".m2"
         ):
             return MAVEN_PATTERN
 
-        return match_patterns(path, self.patterns)
+        return self._matcher.match_entry(name, path)
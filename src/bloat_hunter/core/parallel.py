@@ -3,9 +3,10 @@
 from __future__ import annotations
 
 import os
-from collections.abc import Callable, Iterator
-from concurrent.futures import ThreadPoolExecutor, as_completed
+from collections.abc import Callable, Iterable, Iterator, Sized
+from concurrent.futures import FIRST_COMPLETED, Future, ThreadPoolExecutor, as_completed, wait
 from dataclasses import dataclass
+from pathlib import Path
 from typing import TypeVar
 
 T = TypeVar("T")
@@ -17,6 +18,9 @@ DEFAULT_WORKERS = min(os.cpu_count() or 4, 8)
 # Minimum items needed to benefit from parallel execution
 MIN_PARALLEL_ITEMS = 2
 
+# Tasks kept queued per worker so the pool never idles waiting on submission
+QUEUE_DEPTH_PER_WORKER = 4
+
 
 @dataclass
 class ParallelConfig:
@@ -34,17 +38,20 @@ class ParallelConfig:
 
 def parallel_map(
     func: Callable[[T], R],
-    items: list[T],
+    items: Iterable[T],
     config: ParallelConfig | None = None,
 ) -> Iterator[tuple[T, R | None, Exception | None]]:
     """
     Apply a function to items in parallel.
 
-    Yields results as they complete, with error handling per item.
+    Yields results as they complete, with error handling per item. Only a
+    bounded window of items is submitted at a time, so results start
+    streaming immediately and memory stays flat for very large inputs while
+    I/O-bound workers keep overlapping with each other.
 
     Args:
         func: Function to apply to each item
-        items: List of items to process
+        items: Items to process (any iterable; consumed lazily)
         config: Parallel execution configuration
 
     Yields:
@@ -54,9 +61,11 @@ def parallel_map(
     if config is None:
         config = ParallelConfig()
 
-    if not config.enabled or len(items) < MIN_PARALLEL_ITEMS:
+    items_iter = iter(items)
+
+    if not config.enabled or (isinstance(items, Sized) and len(items) < MIN_PARALLEL_ITEMS):
         # Sequential fallback
-        for item in items:
+        for item in items_iter:
             try:
                 result = func(item)
                 yield (item, result, None)
@@ -64,16 +73,31 @@ def parallel_map(
                 yield (item, None, e)
         return
 
+    window = config.max_workers * QUEUE_DEPTH_PER_WORKER
+
     with ThreadPoolExecutor(max_workers=config.max_workers) as executor:
-        future_to_item = {executor.submit(func, item): item for item in items}
+        pending: dict[Future[R], T] = {}
 
-        for future in as_completed(future_to_item):
-            item = future_to_item[future]
-            try:
-                result = future.result()
-                yield (item, result, None)
-            except Exception as e:
-                yield (item, None, e)
+        for item in items_iter:
+            pending[executor.submit(func, item)] = item
+            if len(pending) >= window:
+                break
+
+        while pending:
+            done, _ = wait(pending, return_when=FIRST_COMPLETED)
+            for future in done:
+                item = pending.pop(future)
+
+                # Refill the window before handing control back to the caller
+                for next_item in items_iter:
+                    pending[executor.submit(func, next_item)] = next_item
+                    break
+
+                try:
+                    result = future.result()
+                    yield (item, result, None)
+                except Exception as e:
+                    yield (item, None, e)
 
 
 def parallel_map_ordered(
@@ -121,3 +145,89 @@ def parallel_map_ordered(
                     results[idx] = (item, None, e)
 
     return results  # type: ignore[return-value]
+
+
+def parallel_walk(
+    func: Callable[[T], tuple[list[T], R]],
+    roots: list[T],
+    config: ParallelConfig | None = None,
+) -> Iterator[tuple[T, R | None, Exception | None]]:
+    """
+    Process a tree of work items in parallel, scheduling children as they appear.
+
+    Each call to ``func`` handles one node (typically one directory) and returns
+    the child nodes to visit next along with its own result. Children are
+    submitted to the pool as soon as their parent completes, so independent
+    subtrees are walked concurrently. Results are yielded on the calling thread,
+    so callers can merge them without locking.
+
+    Args:
+        func: Function returning (children, result) for a node
+        roots: Initial nodes to process
+        config: Parallel execution configuration
+
+    Yields:
+        Tuple of (item, result, error) for each processed node.
+        If successful, error is None. If failed, result is None and the
+        node's children are not visited.
+    """
+    if config is None:
+        config = ParallelConfig()
+
+    if not config.enabled:
+        # Sequential fallback (depth-first, explicit stack)
+        stack = list(reversed(roots))
+        while stack:
+            item = stack.pop()
+            try:
+                children, result = func(item)
+            except Exception as e:
+                yield (item, None, e)
+                continue
+            stack.extend(reversed(children))
+            yield (item, result, None)
+        return
+
+    with ThreadPoolExecutor(max_workers=config.max_workers) as executor:
+        pending: dict[Future[tuple[list[T], R]], T] = {
+            executor.submit(func, item): item for item in roots
+        }
+
+        while pending:
+            done, _ = wait(pending, return_when=FIRST_COMPLETED)
+            for future in done:
+                item = pending.pop(future)
+                try:
+                    children, result = future.result()
+                except Exception as e:
+                    yield (item, None, e)
+                    continue
+
+                for child in children:
+                    pending[executor.submit(func, child)] = child
+
+                yield (item, result, None)
+
+
+def get_directory_sizes_parallel(
+    paths: list[Path],
+    size_func: Callable[[Path], tuple[int, int]],
+    config: ParallelConfig | None = None,
+) -> dict[Path, tuple[int, int]]:
+    """
+    Calculate sizes for multiple directories in parallel.
+
+    Args:
+        paths: Directories to size
+        size_func: Function returning (total_bytes, file_count) for a path
+        config: Parallel execution configuration
+
+    Returns:
+        Dict mapping each path to its (total_bytes, file_count).
+        Paths whose size calculation failed are omitted.
+    """
+    return {
+        path: sizes
+        for path, sizes, error in parallel_map(size_func, paths, config)
+        if error is None and sizes is not None
+    }
@@ -0,0 +1,146 @@
+"""Short-lived cache of scan results, so `clean` can reuse a preceding `scan`."""
+
+from __future__ import annotations
+
+import hashlib
+import json
+import os
+import stat
+import time
+from pathlib import Path
+
+from bloat_hunter.config import get_cache_dir
+from bloat_hunter.core.scanner import BloatTarget, ScanResult
+from bloat_hunter.patterns import get_all_patterns
+
+# Cached results older than this are ignored (seconds)
+SCAN_CACHE_TTL = 300
+
+# Bump when the stored payload layout changes
+_CACHE_VERSION = 2
+
+
+def get_scan_cache_path(
+    root: Path, deep: bool, min_size: int, exclude: frozenset[str] = frozenset()
+) -> Path:
+    """
+    Get the cache file for a scan of root with the given options.
+
+    Args:
+        root: Scanned directory
+        deep: Whether the scan was deep
+        min_size: Minimum target size of the scan
+        exclude: Directory names excluded from the scan
+
+    Returns:
+        Path of the cache file for this combination of options.
+    """
+    key = "\0".join([str(root.resolve()), str(deep), str(min_size), *sorted(exclude)])
+    digest = hashlib.sha256(os.fsencode(key)).hexdigest()[:16]
+    return get_cache_dir() / f"scan-{digest}.json"
+
+
+def _target_signature(path: str) -> tuple[int, int] | None:
+    """
+    Get the (inode, mtime_ns) a target directory is checked against on reuse.
+
+    Uses lstat, so a target that has been replaced by a symlink, a file or a
+    new directory no longer matches.
+
+    Args:
+        path: Target directory path
+
+    Returns:
+        Tuple of (inode, mtime_ns), or None if path is not a real directory.
+    """
+    try:
+        st = os.lstat(path)
+    except OSError:
+        return None
+    if not stat.S_ISDIR(st.st_mode):
+        return None
+    return st.st_ino, st.st_mtime_ns
+
+
+def save_scan_result(result: ScanResult, cache_path: Path) -> None:
+    """Store a scan result, silently skipping if the cache is unwritable."""
+    targets = []
+    for t in result.targets:
+        path = str(t.path)
+        signature = _target_signature(path)
+        if signature is None:
+            return  # Target changed during the scan; don't offer it for reuse
+        targets.append([path, t.pattern.name, t.size_bytes, t.file_count, *signature])
+
+    try:
+        payload = {
+            "version": _CACHE_VERSION,
+            "created": time.time(),
+            "root_mtime_ns": result.root_path.stat().st_mtime_ns,
+            "total_size": result.total_size,
+            "scan_errors": result.scan_errors,
+            "targets": targets,
+        }
+        cache_path.parent.mkdir(parents=True, exist_ok=True)
+        tmp_path = cache_path.with_suffix(".tmp")
+        tmp_path.write_text(json.dumps(payload), encoding="utf-8")
+        os.replace(tmp_path, cache_path)
+    except OSError:
+        pass
+
+
+def load_scan_result(root: Path, cache_path: Path) -> tuple[ScanResult, float] | None:
+    """
+    Load a cached scan result if it is still fresh.
+
+    A result is fresh if it is younger than SCAN_CACHE_TTL, root's mtime
+    has not changed since it was stored, and every target is still the same
+    real directory (same inode and mtime, not a symlink). A change anywhere
+    in the result means a rescan, so clean never acts on stale targets.
+
+    Args:
+        root: Directory about to be scanned
+        cache_path: Cache file from get_scan_cache_path()
+
+    Returns:
+        Tuple of (result, age_seconds), or None if there is no fresh result.
+    """
+    try:
+        payload = json.loads(cache_path.read_text(encoding="utf-8"))
+        root_mtime_ns = root.stat().st_mtime_ns
+    except (OSError, ValueError):
+        return None
+
+    if not isinstance(payload, dict) or payload.get("version") != _CACHE_VERSION:
+        return None
+
+    patterns = {p.name: p for p in get_all_patterns()}
+    try:
+        age = time.time() - payload["created"]
+        if not 0 <= age < SCAN_CACHE_TTL or payload["root_mtime_ns"] != root_mtime_ns:
+            return None
+
+        result = ScanResult(
+            root_path=root,
+            total_size=payload["total_size"],
+            scan_errors=payload["scan_errors"],
+        )
+        for path, pattern_name, size_bytes, file_count, ino, mtime_ns in payload["targets"]:
+            pattern = patterns.get(pattern_name)
+            if pattern is None:
+                return None  # Pattern set changed since the scan
+            if _target_signature(path) != (ino, mtime_ns):
+                return None  # Target removed, rebuilt or replaced since the scan
+            result.targets.append(BloatTarget(Path(path), pattern, size_bytes, file_count))
+    except (KeyError, TypeError, ValueError):
+        return None  # Truncated or hand-edited cache file
+
+    return result, age
+
+
+def clear_scan_result(cache_path: Path) -> None:
+    """Remove a cached scan result, e.g. before its targets are deleted."""
+    try:
+        cache_path.unlink(missing_ok=True)
+    except OSError:
+        pass
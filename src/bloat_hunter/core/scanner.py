@@ -3,6 +3,7 @@
 from __future__ import annotations
 
 import os
+import time
 from dataclasses import dataclass, field
 from pathlib import Path
 from typing import TYPE_CHECKING
@@ -13,14 +14,17 @@ from rich.progress import BarColumn, Progress, SpinnerColumn, TaskProgressColumn
 if TYPE_CHECKING:
     from rich.progress import TaskID
 
-from collections.abc import Callable
+from collections.abc import Callable, Sequence
+from functools import partial
 
-from bloat_hunter.core.parallel import ParallelConfig, parallel_map
-from bloat_hunter.patterns import BloatPattern, get_all_patterns
-from bloat_hunter.safety.protected import is_protected_path
+from bloat_hunter.core.parallel import ParallelConfig, parallel_map, parallel_walk
+from bloat_hunter.core.sizes import format_size
+from bloat_hunter.core.sizes import parse_size as parse_size  # Re-exported for existing importers
+from bloat_hunter.patterns import NEVER_DESCEND, BloatPattern, PatternMatcher, get_all_patterns
+from bloat_hunter.safety.protected import is_protected_path, is_protected_scan_path
 
 
-@dataclass
+@dataclass(slots=True)
 class BloatTarget:
     """Represents a detected bloat target."""
 
@@ -55,96 +59,85 @@ class ScanResult:
         return format_size(self.total_size)
 
 
-def format_size(size_bytes: int) -> str:
-    """Convert bytes to human-readable format."""
-    size = float(size_bytes)
-    for unit in ["B", "KB", "MB", "GB", "TB"]:
-        if size < 1024:
-            return f"{size:.1f} {unit}"
-        size /= 1024
-    return f"{size:.1f} PB"
+# scandir() over an open directory fd makes DirEntry.stat() use fstatat()
+# relative to that fd, so the kernel resolves a single path component per file
+# instead of the full path. Windows lacks fd-based scandir and uses paths.
+_SCANDIR_FD = os.scandir in os.supports_fd and hasattr(os, "O_DIRECTORY")
+_DIR_OPEN_FLAGS = os.O_RDONLY | getattr(os, "O_DIRECTORY", 0) | getattr(os, "O_CLOEXEC", 0)
 
 
-def parse_size(size_str: str) -> int:
-    """
-    Parse human-readable size string to bytes.
+def _sum_dir_entries(
+    target: bytes | int,
+    dir_path: bytes,
+    stack: list[bytes],
+) -> tuple[int, int]:
+    """Sum file sizes in one directory, pushing subdirectories onto the stack.
 
     Args:
-        size_str: Size string like "1KB", "10MB", "1.5GB"
-
-    Returns:
-        Size in bytes
-
-    Raises:
-        ValueError: If the size string is invalid
+        target: Directory path, or an open fd for that directory
+        dir_path: Directory path, used to build subdirectory paths
+        stack: Pending directories to visit
     """
-    size_str = size_str.strip().upper()
-
-    # Check longer units first to avoid "KB" matching "B"
-    units = [
-        ("TB", 1024 * 1024 * 1024 * 1024),
-        ("GB", 1024 * 1024 * 1024),
-        ("MB", 1024 * 1024),
-        ("KB", 1024),
-        ("B", 1),
-    ]
-
-    for unit, multiplier in units:
-        if size_str.endswith(unit):
+    total_size = 0
+    file_count = 0
+
+    with os.scandir(target) as entries:
+        for entry in entries:
             try:
-                value = float(size_str[: -len(unit)])
-            except ValueError:
-                raise ValueError(f"Invalid size value: {size_str}") from None
-            if value < 0:
-                raise ValueError(f"Size cannot be negative: {size_str}")
-            return int(value * multiplier)
-
-    # No unit specified, assume bytes
-    try:
-        value = float(size_str)
-    except ValueError:
-        raise ValueError(f"Invalid size string: {size_str}") from None
-    if value < 0:
-        raise ValueError(f"Size cannot be negative: {size_str}")
-    return int(value)
+                if entry.is_symlink():
+                    continue
+                if entry.is_file(follow_symlinks=False):
+                    total_size += entry.stat(follow_symlinks=False).st_size
+                    file_count += 1
+                elif entry.is_dir(follow_symlinks=False):
+                    # fd-based scandir yields str names; path-based yields bytes
+                    stack.append(os.path.join(dir_path, os.fsencode(entry.name)))
+            except (PermissionError, OSError):
+                continue
+
+    return total_size, file_count
 
 
-def get_directory_size(path: Path) -> tuple[int, int]:
+def get_directory_size(path: Path | str) -> tuple[int, int]:
     """
     Calculate directory size efficiently using os.scandir.
 
+    Paths are kept as bytes throughout the walk, so directory opens skip
+    the str-to-filesystem-encoding step on every call.
+
     Returns:
         Tuple of (total_bytes, file_count)
     """
     total_size = 0
     file_count = 0
+    stack: list[bytes] = [os.fsencode(path)]
 
-    try:
-        with os.scandir(path) as entries:
-            for entry in entries:
+    while stack:
+        dir_path = stack.pop()
+        try:
+            if _SCANDIR_FD:
+                fd = os.open(dir_path, _DIR_OPEN_FLAGS)
                 try:
-                    if entry.is_symlink():
-                        continue
-                    if entry.is_file(follow_symlinks=False):
-                        total_size += entry.stat(follow_symlinks=False).st_size
-                        file_count += 1
-                    elif entry.is_dir(follow_symlinks=False):
-                        sub_size, sub_count = get_directory_size(Path(entry.path))
-                        total_size += sub_size
-                        file_count += sub_count
-                except (PermissionError, OSError):
-                    continue
-    except (PermissionError, OSError):
-        pass
+                    size, count = _sum_dir_entries(fd, dir_path, stack)
+                finally:
+                    os.close(fd)
+            else:
+                size, count = _sum_dir_entries(dir_path, dir_path, stack)
+        except (PermissionError, OSError):
+            continue
+
+        total_size += size
+        file_count += count
 
     return total_size, file_count
 
 
-def calc_target(item: tuple[Path, BloatPattern]) -> BloatTarget | None:
+def calc_target(item: tuple[str, BloatPattern]) -> BloatTarget | None:
     """
     Create a BloatTarget with size calculation for a matched path.
 
-    Shared utility for cache_scanner and package_scanner.
+    Shared utility for cache_scanner and package_scanner. The Path is only
+    built for targets that are kept.
 
     Args:
         item: Tuple of (path, pattern) to calculate size for
@@ -157,7 +150,7 @@ def calc_target(item: tuple[Path, BloatPattern]) -> BloatTarget | None:
         size, count = get_directory_size(path)
         if size >= pattern.min_size:
             return BloatTarget(
-                path=path,
+                path=Path(path),
                 pattern=pattern,
                 size_bytes=size,
                 file_count=count,
@@ -167,7 +160,7 @@ def calc_target(item: tuple[Path, BloatPattern]) -> BloatTarget | None:
     return None
 
 
-def calc_size(item: tuple[Path, BloatPattern]) -> tuple[Path, BloatPattern, int, int]:
+def calc_size(item: tuple[str, BloatPattern]) -> tuple[str, BloatPattern, int, int]:
     """
     Calculate size for a matched directory.
 
@@ -205,65 +198,168 @@ def match_patterns(
     return None
 
 
+def _scan_pattern_dir(
+    item: tuple[str, int],
+    pattern_matcher: Callable[[str, str], BloatPattern | None],
+    max_depth: int,
+) -> tuple[list[tuple[str, int]], list[tuple[str, BloatPattern]]]:
+    """
+    Scan one directory for subdirectories matching a pattern.
+
+    Args:
+        item: Tuple of (directory path, depth)
+        pattern_matcher: Callback to match a directory's (name, path) against patterns
+        max_depth: Maximum traversal depth
+
+    Returns:
+        Tuple of (unmatched subdirectories to visit next, matches found)
+    """
+    dir_path, depth = item
+    children: list[tuple[str, int]] = []
+    found: list[tuple[str, BloatPattern]] = []
+
+    with os.scandir(dir_path) as entries:
+        for entry in entries:
+            if not entry.is_dir(follow_symlinks=False):
+                continue
+
+            if is_protected_scan_path(entry.path):
+                continue
+
+            matched = pattern_matcher(entry.name, entry.path)
+            if matched:
+                found.append((entry.path, matched))
+            elif depth < max_depth and entry.name not in NEVER_DESCEND:
+                # Descend deeper for nested caches
+                children.append((entry.path, depth + 1))
+
+    return children, found
+
+
+# Redraw rate of scan progress displays; Rich's default of 10 Hz is a
+# noticeable share of short scans
+SCAN_REFRESH_PER_SECOND = 4
+
+
+def scan_progress(console: Console) -> Progress:
+    """
+    Create the progress display shared by both phases of a scan.
+
+    Phase 1 runs an indeterminate task; Phase 2 hides it and adds a sized
+    task, so the live display is only started and torn down once per scan.
+
+    Args:
+        console: Console to render to
+
+    Returns:
+        Progress to use as a context manager
+    """
+    return Progress(
+        SpinnerColumn(),
+        TextColumn("[progress.description]{task.description}"),
+        BarColumn(),
+        TaskProgressColumn(),
+        console=console,
+        refresh_per_second=SCAN_REFRESH_PER_SECOND,
+    )
+
+
+def sizing_reporter(progress: Progress, task_id: TaskID, total: int) -> Callable[[str], None]:
+    """
+    Build a callback that advances a sizing task by one result.
+
+    The task is only updated once per redraw interval (and on the last
+    result), so a scan with many matches doesn't format a description and
+    take Rich's lock for every result.
+
+    Args:
+        progress: Progress display holding the task
+        task_id: Sizing task
+        total: Number of results expected
+
+    Returns:
+        Callback taking the path of each sized directory
+    """
+    done = 0
+    next_update = 0.0
+
+    def report(path: str) -> None:
+        nonlocal done, next_update
+        done += 1
+        now = time.monotonic()
+        if now >= next_update or done == total:
+            progress.update(
+                task_id, completed=done, description=f"Sizing: {os.path.basename(path)[:40]}"
+            )
+            next_update = now + 1 / SCAN_REFRESH_PER_SECOND
+
+    return report
+
+
 def collect_pattern_matches(
-    path: Path,
-    matches: list[tuple[Path, BloatPattern]],
+    roots: Sequence[Path],
+    matches: list[tuple[str, BloatPattern]],
     scan_errors: list[str],
-    pattern_matcher: Callable[[Path], BloatPattern | None],
-    depth: int = 0,
+    pattern_matcher: Callable[[str, str], BloatPattern | None],
     max_depth: int = 3,
+    parallel_config: ParallelConfig | None = None,
+    on_dir: Callable[[str], None] | None = None,
 ) -> None:
     """
-    Recursively collect pattern matches from a directory tree.
+    Collect pattern matches from one or more directory trees.
 
-    Shared utility for cache_scanner and package_scanner.
+    Shared utility for cache_scanner and package_scanner. A root that matches
+    a pattern itself is reported without descending into it. All other roots
+    are walked together through one parallel_walk, so a slow root (e.g. a
+    Windows drive under WSL) does not hold up the others. A directory reached
+    from several overlapping roots is only reported once, so it is sized once.
 
     Args:
-        path: Directory path to scan
+        roots: Directories to scan
         matches: List to append (path, pattern) tuples to
         scan_errors: List to append error messages to
-        pattern_matcher: Callback to match a path against patterns
-        depth: Current recursion depth (0 = root)
-        max_depth: Maximum recursion depth
+        pattern_matcher: Callback to match a directory's (name, path) against patterns
+        max_depth: Maximum traversal depth below each root
+        parallel_config: Parallel execution configuration
+        on_dir: Optional callback invoked with each directory as it is scanned
     """
-    if is_protected_path(path, for_scanning=True):
-        return
+    walk_roots: list[tuple[str, int]] = []
+    seen = {path for path, _ in matches}
+
+    for root in roots:
+        root_str = str(root)
+        if root_str in seen or is_protected_path(root, for_scanning=True):
+            continue
 
-    # At depth=0, try to match the root itself first
-    if depth == 0:
-        matched = pattern_matcher(path)
+        try:
+            matched = pattern_matcher(root.name, root_str)
+        except OSError as e:
+            scan_errors.append(f"{root}: {e}")
+            continue
+
+        seen.add(root_str)
         if matched:
-            matches.append((path, matched))
-            return
+            matches.append((root_str, matched))
+        else:
+            walk_roots.append((root_str, 0))
 
-    # Don't recurse beyond max_depth
-    if depth > max_depth:
+    if not walk_roots:
         return
 
-    # Scan subdirectories
-    try:
-        with os.scandir(path) as entries:
-            for entry in entries:
-                if not entry.is_dir(follow_symlinks=False):
-                    continue
+    scan_dir = partial(_scan_pattern_dir, pattern_matcher=pattern_matcher, max_depth=max_depth)
 
-                entry_path = Path(entry.path)
-
-                if is_protected_path(entry_path, for_scanning=True):
-                    continue
+    for item, found, error in parallel_walk(scan_dir, walk_roots, parallel_config):
+        if on_dir is not None:
+            on_dir(item[0])
 
-                matched = pattern_matcher(entry_path)
-                if matched:
-                    matches.append((entry_path, matched))
-                else:
-                    # Recurse deeper for nested caches
-                    collect_pattern_matches(
-                        entry_path, matches, scan_errors, pattern_matcher,
-                        depth + 1, max_depth
-                    )
+        if error is not None:
+            scan_errors.append(f"{item[0]}: {error}")
+            continue
 
-    except (PermissionError, OSError) as e:
-        scan_errors.append(f"{path}: {e}")
+        for match in found or ():
+            if match[0] not in seen:
+                seen.add(match[0])
+                matches.append(match)
 
 
 class Scanner:
@@ -274,11 +370,15 @@ class Scanner:
         console: Console | None = None,
         min_size: int = 0,
         parallel_config: ParallelConfig | None = None,
+        exclude: frozenset[str] = frozenset(),
     ):
         self.console = console or Console()
         self.patterns = get_all_patterns()
+        self._matcher = PatternMatcher(self.patterns)
         self.min_size = min_size
         self.parallel_config = parallel_config or ParallelConfig()
+        # Directory names never matched or descended into
+        self.exclude = exclude
 
     def scan(self, root: Path, deep: bool = False) -> ScanResult:
         """
@@ -292,53 +392,42 @@ class Scanner:
             ScanResult with all detected targets
         """
         result = ScanResult(root_path=root)
-        matches: list[tuple[Path, BloatPattern]] = []
+        matches: list[tuple[str, BloatPattern]] = []
 
         # Phase 1: Find all matching directories
-        with Progress(
-            SpinnerColumn(),
-            TextColumn("[progress.description]{task.description}"),
-            console=self.console,
-        ) as progress:
+        with scan_progress(self.console) as progress:
             task = progress.add_task("Scanning for bloat...", total=None)
             max_depth = 10 if deep else 5
             self._collect_matches(
                 root, matches, result, progress, task, depth=0, max_depth=max_depth
             )
 
-        if not matches:
-            return result
-
-        # Phase 2: Calculate sizes in parallel
-        with Progress(
-            SpinnerColumn(),
-            TextColumn("[progress.description]{task.description}"),
-            BarColumn(),
-            TaskProgressColumn(),
-            console=self.console,
-        ) as progress:
+            if not matches:
+                return result
+
+            # Phase 2: Calculate sizes in parallel
+            progress.update(task, visible=False)
             task = progress.add_task("Calculating sizes...", total=len(matches))
+            report = sizing_reporter(progress, task, len(matches))
 
             for item, size_result, error in parallel_map(
                 calc_size, matches, self.parallel_config
             ):
                 path, pattern = item
-                progress.update(task, description=f"Sizing: {path.name[:40]}")
+                report(path)
 
                 if error is None and size_result is not None:
                     _, _, size, count = size_result
                     # Only add if size meets minimum thresholds (pattern + user)
                     if size > 0 and size >= pattern.min_size and size >= self.min_size:
                         target = BloatTarget(
-                            path=path,
+                            path=Path(path),
                             pattern=pattern,
                             size_bytes=size,
                             file_count=count,
                         )
                         result.targets.append(target)
 
-                progress.advance(task)
-
         # Sort by size descending
         result.targets.sort(key=lambda t: t.size_bytes, reverse=True)
         result.total_size = sum(t.size_bytes for t in result.targets)
@@ -348,45 +437,59 @@ class Scanner:
     def _collect_matches(
         self,
         path: Path,
-        matches: list[tuple[Path, BloatPattern]],
+        matches: list[tuple[str, BloatPattern]],
         result: ScanResult,
         progress: Progress,
         task_id: TaskID,
         depth: int,
         max_depth: int,
     ) -> None:
-        """Recursively collect matching directories without calculating sizes."""
+        """Collect matching directories without calculating sizes.
+
+        Directories are scanned concurrently via parallel_walk; matches and
+        errors are merged back on the calling thread.
+        """
         if depth > max_depth:
             return
 
-        if is_protected_path(path, for_scanning=True):
-            return
+        scan_dir = partial(self._scan_dir, max_depth=max_depth)
 
-        try:
-            with os.scandir(path) as entries:
-                for entry in entries:
-                    if not entry.is_dir(follow_symlinks=False):
-                        continue
-
-                    entry_path = Path(entry.path)
-                    progress.update(task_id, description=f"Scanning: {entry_path.name[:40]}")
-
-                    # Check if this directory matches any bloat pattern
-                    matched_pattern = self._match_pattern(entry_path)
-
-                    if matched_pattern:
-                        # Found bloat - add to matches for later size calculation
-                        matches.append((entry_path, matched_pattern))
-                        # Don't recurse into matched directories
-                    else:
-                        # Recurse into subdirectory
-                        self._collect_matches(
-                            entry_path, matches, result, progress, task_id, depth + 1, max_depth
-                        )
+        for item, found, error in parallel_walk(
+            scan_dir, [(str(path), depth)], self.parallel_config
+        ):
+            dir_path, _ = item
+            progress.update(
+                task_id, description=f"Scanning: {os.path.basename(dir_path)[:40]}"
+            )
+
+            if error is not None:
+                result.scan_errors.append(f"{dir_path}: {error}")
+            elif found:
+                matches.extend(found)
+
+    def _scan_dir(
+        self, item: tuple[str, int], max_depth: int
+    ) -> tuple[list[tuple[str, int]], list[tuple[str, BloatPattern]]]:
+        """Scan one directory, returning subdirectories to visit and matches found."""
+        dir_path, depth = item
+        children: list[tuple[str, int]] = []
+        found: list[tuple[str, BloatPattern]] = []
+
+        if is_protected_scan_path(dir_path):
+            return children, found
+
+        with os.scandir(dir_path) as entries:
+            for entry in entries:
+                if entry.name in self.exclude or not entry.is_dir(follow_symlinks=False):
+                    continue
+
+                # Check if this directory matches any bloat pattern
+                matched_pattern = self._matcher.match_entry(entry.name, entry.path)
 
-        except (PermissionError, OSError) as e:
-            result.scan_errors.append(f"{path}: {e}")
+                if matched_pattern:
+                    # Found bloat - sized later; don't descend into it
+                    found.append((entry.path, matched_pattern))
+                elif depth < max_depth:
+                    children.append((entry.path, depth + 1))
 
-    def _match_pattern(self, path: Path) -> BloatPattern | None:
-        """Check if a path matches any bloat pattern."""
-        return match_patterns(path, self.patterns)
+        return children, found
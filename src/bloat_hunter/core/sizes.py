@@ -0,0 +1,79 @@
+"""Human-readable size formatting and parsing."""
+
+from __future__ import annotations
+
+import math
+import re
+from functools import lru_cache
+
+
+def format_size(size_bytes: int) -> str:
+    """Convert bytes to human-readable format."""
+    size = float(size_bytes)
+    for unit in ["B", "KB", "MB", "GB", "TB"]:
+        if size < 1024:
+            return f"{size:.1f} {unit}"
+        size /= 1024
+    return f"{size:.1f} PB"
+
+
+# Digits with optional single underscores between them, as float() accepts
+_DIGITS = r"\d(?:_?\d)*"
+
+# Number (with optional exponent), optional unit prefix, optional "B"/"iB" suffix
+# (e.g. "1.5GB", "1e3", "1_000", "10k", "2 MiB")
+_SIZE_RE = re.compile(
+    rf"^\s*([+-]?(?:{_DIGITS}(?:\.(?:{_DIGITS})?)?|\.{_DIGITS})(?:E[+-]?{_DIGITS})?)"
+    r"\s*([KMGT]?)(?:I?B)?\s*$",
+    re.IGNORECASE,
+)
+
+# A bad string ending in one of these units is reported as an invalid value
+_UNIT_SUFFIXES = ("TB", "GB", "MB", "KB", "B")
+
+_SIZE_MULTIPLIERS = {
+    "": 1,
+    "K": 1 << 10,
+    "M": 1 << 20,
+    "G": 1 << 30,
+    "T": 1 << 40,
+}
+
+
+@lru_cache(maxsize=128)
+def parse_size(size_str: str) -> int:
+    """
+    Parse human-readable size string to bytes.
+
+    Results are memoized: the same few literals ("0B", "1MB") are parsed by
+    every command and on each read of the config min_size_bytes properties.
+
+    Args:
+        size_str: Size string like "1KB", "10MB", "1.5GB"
+
+    Returns:
+        Size in bytes
+
+    Raises:
+        ValueError: If the size string is invalid
+    """
+    normalized = size_str.strip().upper()
+    match = _SIZE_RE.match(normalized)
+    if match is None:
+        raise _invalid_size(normalized)
+
+    value = float(match.group(1))
+    if value < 0:
+        raise ValueError(f"Size cannot be negative: {normalized}")
+
+    size = value * _SIZE_MULTIPLIERS[match.group(2)]
+    if not math.isfinite(size):
+        raise _invalid_size(normalized)  # e.g. "1e400", which float() reads as inf
+    return int(size)
+
+
+def _invalid_size(normalized: str) -> ValueError:
+    """Build the error for an unparseable, upper-cased size string."""
+    if normalized.endswith(_UNIT_SUFFIXES):
+        return ValueError(f"Invalid size value: {normalized}")
+    return ValueError(f"Invalid size string: {normalized}")
@@ -2,7 +2,7 @@
 
 from __future__ import annotations
 
-from .base import BloatPattern
+from .base import BloatPattern, PatternMatcher
 from .browser_cache import (
     APP_CACHE_PATTERNS,
     BROWSER_CACHE_PATTERNS,
@@ -12,7 +12,7 @@ from .browser_cache import (
 )
 from .cache import CACHE_PATTERNS
 from .dev import DEV_PATTERNS
-from .system import SYSTEM_PATTERNS
+from .system import NEVER_DESCEND, SYSTEM_PATTERNS
 
 
 def get_all_patterns() -> list[BloatPattern]:
@@ -34,6 +34,7 @@ def get_all_patterns_including_system_caches() -> list[BloatPattern]:
 
 __all__ = [
     "BloatPattern",
+    "PatternMatcher",
     "get_all_patterns",
     "get_all_patterns_including_system_caches",
     "get_browser_cache_patterns",
@@ -41,4 +42,5 @@ __all__ = [
     "BROWSER_CACHE_PATTERNS",
     "PACKAGE_MANAGER_PATTERNS",
     "APP_CACHE_PATTERNS",
+    "NEVER_DESCEND",
 ]
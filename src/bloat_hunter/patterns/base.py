@@ -36,3 +36,79 @@ class BloatPattern:
                     return True
 
         return False
+
+
+class PatternMatcher:
+    """
+    Matches directory names against a list of patterns in one pass.
+
+    Exact names are looked up in a dict and every regex is folded into a
+    single alternation, so a name that matches nothing (the common case)
+    costs one dict lookup and one regex match instead of a compare per
+    pattern. A literal name whose result cannot depend on the path (e.g.
+    node_modules) is answered by the first lookup alone. Results are the
+    same as calling BloatPattern.matches on each pattern in list order.
+    """
+
+    def __init__(self, patterns: list[BloatPattern]):
+        self.patterns = patterns
+        self._exact: dict[str, list[int]] = {}
+        self._regexes: list[tuple[int, re.Pattern[str]]] = []
+
+        for index, pattern in enumerate(patterns):
+            for name_pattern in pattern.patterns:
+                if name_pattern.startswith("re:"):
+                    self._regexes.append((index, re.compile(name_pattern[3:])))
+                else:
+                    self._exact.setdefault(name_pattern, []).append(index)
+
+        self._any_regex = (
+            re.compile("|".join(f"(?:{regex.pattern})" for _, regex in self._regexes))
+            if self._regexes
+            else None
+        )
+
+        # Names whose answer never depends on the path: the first exact
+        # candidate has no validator and precedes every regex pattern
+        first_regex = self._regexes[0][0] if self._regexes else len(patterns)
+        self._literal: dict[str, BloatPattern] = {
+            name: patterns[indices[0]]
+            for name, indices in self._exact.items()
+            if indices[0] < first_regex and patterns[indices[0]].validator is None
+        }
+
+    def match(self, path: Path) -> BloatPattern | None:
+        """Return the first pattern matching the path, or None."""
+        return self._match(path.name, path)
+
+    def match_entry(self, name: str, path: str) -> BloatPattern | None:
+        """
+        Return the first pattern matching a directory entry, or None.
+
+        Takes the name and path strings of an os.DirEntry so walkers don't
+        build a Path per entry; one is only built if a validator needs it.
+        """
+        return self._match(name, path)
+
+    def _match(self, name: str, path: Path | str) -> BloatPattern | None:
+        literal = self._literal.get(name)
+        if literal is not None:
+            return literal
+
+        candidates = self._exact.get(name, [])
+
+        if self._any_regex is not None and self._any_regex.match(name):
+            candidates = sorted(
+                {*candidates, *(index for index, regex in self._regexes if regex.match(name))}
+            )
+
+        for index in candidates:
+            pattern = self.patterns[index]
+            if pattern.validator is None:
+                return pattern
+            if isinstance(path, str):
+                path = Path(path)
+            if pattern.validator(path):
+                return pattern
+
+        return None
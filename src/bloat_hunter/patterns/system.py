@@ -78,3 +78,9 @@ SYSTEM_PATTERNS: list[BloatPattern] = [
         safe_level="safe",
     ),
 ]
+
+# Directory names the cache walkers never descend into: VCS metadata holds no
+# caches, but a large repository's object store spans thousands of directories
+NEVER_DESCEND: frozenset[str] = frozenset(
+    name for pattern in SYSTEM_PATTERNS if pattern.category == "VCS" for name in pattern.patterns
+)
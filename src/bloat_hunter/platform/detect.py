@@ -2,6 +2,7 @@
 
 from __future__ import annotations
 
+import functools
 import os
 import platform
 from dataclasses import dataclass
@@ -43,7 +44,7 @@ class XdgPaths:
         )
 
 
-@dataclass
+@dataclass(frozen=True)
 class PlatformInfo:
     """Information about the current platform."""
 
@@ -115,8 +116,14 @@ def _get_linux_distro() -> str:
     return "Linux"
 
 
+@functools.lru_cache(maxsize=1)
 def get_platform_info() -> PlatformInfo:
-    """Detect and return current platform information."""
+    """
+    Detect and return current platform information.
+
+    The result is cached for the lifetime of the process, since detection reads
+    /proc and /etc files and may list /mnt/c/Users under WSL.
+    """
     system = platform.system()
     home_dir = Path.home()
 
@@ -2,6 +2,6 @@
 
 from __future__ import annotations
 
-from .protected import PROTECTED, ProtectedConfig, is_protected_path
+from .protected import PROTECTED, ProtectedConfig, is_protected_path, is_protected_scan_path
 
-__all__ = ["is_protected_path", "PROTECTED", "ProtectedConfig"]
+__all__ = ["is_protected_path", "is_protected_scan_path", "PROTECTED", "ProtectedConfig"]
@@ -92,6 +92,54 @@ PROTECTED = ProtectedConfig(
     }),
 )
 
+# Lowercased system paths and "<path><sep>" prefixes, so one membership test
+# and one startswith() replace a loop over every protected path
+_SYSTEM_PATHS_LOWER = frozenset(p.lower() for p in PROTECTED.system_paths)
+_SYSTEM_PREFIXES_LOWER = tuple(p + os.sep for p in _SYSTEM_PATHS_LOWER)
+
+# Directory names that stay scannable even under a protected system path
+_CACHE_NAMES = frozenset({
+    # Python
+    "__pycache__",
+    ".pytest_cache",
+    ".mypy_cache",
+    ".ruff_cache",
+    ".tox",
+    ".nox",
+    # Node.js
+    "node_modules",
+    ".next",
+    ".nuxt",
+    ".parcel-cache",
+    # Generic
+    ".cache",
+    # Browser caches
+    "Cache",
+    "Code Cache",
+    "GPUCache",
+    "ShaderCache",
+    "GrShaderCache",
+    "Media Cache",
+    "cache2",
+    "startupCache",
+    # Package manager caches
+    "_cacache",
+    "_npx",
+    "go-build",
+    # App caches
+    "CachedData",
+    "CachedExtensions",
+    "thumbnails",
+    "fontconfig",
+    "Crashpad",
+    "blob_storage",
+})
+
+# Folders directly under home that are never deleted
+_HOME_CRITICAL_FOLDERS = frozenset({
+    "Documents", "Desktop", "Downloads", "Pictures", "Music", "Videos"
+})
+
 
 def is_protected_path(path: Path, for_scanning: bool = False) -> bool:
     """
@@ -109,12 +157,10 @@ def is_protected_path(path: Path, for_scanning: bool = False) -> bool:
     path_lower = path_str.lower()
 
     # Check absolute protected paths (always skip these)
-    for protected in PROTECTED.system_paths:
-        protected_lower = protected.lower()
-        if path_lower == protected_lower or path_lower.startswith(protected_lower + os.sep):
-            # Allow if we're looking at a subdirectory that's specifically a cache
-            if not _is_cache_subdirectory(path):
-                return True
+    if path_lower in _SYSTEM_PATHS_LOWER or path_lower.startswith(_SYSTEM_PREFIXES_LOWER):
+        # Allow if we're looking at a subdirectory that's specifically a cache
+        if not _is_cache_subdirectory(path):
+            return True
 
     # Check protected names (always skip)
     if path.name in PROTECTED.critical_names:
@@ -122,10 +168,8 @@ def is_protected_path(path: Path, for_scanning: bool = False) -> bool:
 
     # Check if parent is home directory and this is a critical folder
     home = Path.home()
-    if path.parent == home:
-        critical_folders = {"Documents", "Desktop", "Downloads", "Pictures", "Music", "Videos"}
-        if path.name in critical_folders:
-            return True
+    if path.name in _HOME_CRITICAL_FOLDERS and path.parent == home:
+        return True
 
     # Platform-specific checks
     system = platform.system()
@@ -148,45 +192,25 @@ def is_protected_path(path: Path, for_scanning: bool = False) -> bool:
     return False
 
 
+def is_protected_scan_path(path: str) -> bool:
+    """
+    Check if scanning should skip a directory given as a path string.
+
+    Same as is_protected_path(Path(path), for_scanning=True), so directory
+    walkers can pass os.DirEntry.path directly.
+
+    Args:
+        path: Directory path, as produced by os.scandir()
+
+    Returns:
+        True if the directory should not be scanned
+    """
+    return is_protected_path(Path(path), for_scanning=True)
+
+
 def _is_cache_subdirectory(path: Path) -> bool:
     """Check if this is a cache directory that's safe to delete."""
-    cache_names = {
-        # Python
-        "__pycache__",
-        ".pytest_cache",
-        ".mypy_cache",
-        ".ruff_cache",
-        ".tox",
-        ".nox",
-        # Node.js
-        "node_modules",
-        ".next",
-        ".nuxt",
-        ".parcel-cache",
-        # Generic
-        ".cache",
-        # Browser caches
-        "Cache",
-        "Code Cache",
-        "GPUCache",
-        "ShaderCache",
-        "GrShaderCache",
-        "Media Cache",
-        "cache2",
-        "startupCache",
-        # Package manager caches
-        "_cacache",
-        "_npx",
-        "go-build",
-        # App caches
-        "CachedData",
-        "CachedExtensions",
-        "thumbnails",
-        "fontconfig",
-        "Crashpad",
-        "blob_storage",
-    }
-    return path.name in cache_names
+    return path.name in _CACHE_NAMES
 
 
 def _is_windows_protected(path: Path) -> bool:
@@ -13,10 +13,20 @@ from bloat_hunter import __version__
 
 def create_console() -> Console:
     """Create a configured Rich console."""
-    # Windows-specific console settings
+    # Output is styled explicitly with markup, so skip Rich's automatic
+    # highlighting of numbers, paths and URLs in every printed string
     if platform.system() == "Windows":
-        return Console(legacy_windows=True, emoji=False)
-    return Console()
+        # Windows-specific console settings
+        console = Console(legacy_windows=True, emoji=False, highlight=False)
+    else:
+        console = Console(highlight=False)
+
+    if not console.is_terminal:
+        # Piped output can't be resized, so probe the width once rather than
+        # querying the terminal size on every print
+        console.size = console.size
+
+    return console
 
 
 def print_banner(console: Console) -> None:
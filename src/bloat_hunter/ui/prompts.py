@@ -11,6 +11,11 @@ if TYPE_CHECKING:
     from bloat_hunter.core.scanner import BloatTarget
 
 
+def _summarize_selection(selected: list[str]) -> str:
+    """Render the submitted checkbox answer as a count instead of every label."""
+    return f"{len(selected)} selected"
+
+
 def confirm_deletion(count: int) -> bool:
     """
     Prompt user to confirm deletion.
@@ -53,6 +58,7 @@ def select_targets(targets: list[BloatTarget]) -> list[BloatTarget]:
             message="Select targets to delete (Space to toggle, Enter to confirm):",
             choices=choices,
             cycle=True,
+            transformer=_summarize_selection,
         ).execute()
 
         return selected or []
@@ -119,6 +125,7 @@ def select_duplicate_groups(groups: list[DuplicateGroup]) -> list[DuplicateGroup
             message="Select duplicate groups to clean (Space to toggle, Enter to confirm):",
             choices=choices,
             cycle=True,
+            transformer=_summarize_selection,
         ).execute()
 
         return selected or []
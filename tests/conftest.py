@@ -7,6 +7,23 @@ from pathlib import Path
 
 import pytest
 
+from bloat_hunter.config import _load_config_cached, get_config_paths, get_xdg_config_home
+from bloat_hunter.core.scanner import BloatTarget, ScanResult
+from bloat_hunter.patterns.base import BloatPattern
+
+TEST_PATTERN = BloatPattern(
+    name="node_modules", category="JavaScript", patterns=["node_modules"], description="Test"
+)
+
+
+@pytest.fixture(autouse=True)
+def _clear_config_path_caches():
+    """Recompute config paths and reload config after tests change them."""
+    yield
+    get_xdg_config_home.cache_clear()
+    get_config_paths.cache_clear()
+    _load_config_cached.cache_clear()
+
 
 @pytest.fixture
 def temp_dir():
@@ -15,6 +32,31 @@ def temp_dir():
         yield Path(tmpdir)
 
 
+@pytest.fixture
+def bloat_target():
+    """Factory for BloatTargets matched by a test node_modules pattern."""
+
+    def make(path: Path | str, size_bytes: int = 0, file_count: int = 1) -> BloatTarget:
+        return BloatTarget(
+            path=Path(path), pattern=TEST_PATTERN, size_bytes=size_bytes, file_count=file_count
+        )
+
+    return make
+
+
+@pytest.fixture
+def scan_result(bloat_target):
+    """Factory for a ScanResult under /project with one target per path."""
+
+    def make(*paths: Path | str, size_bytes: int = 1024, file_count: int = 1) -> ScanResult:
+        targets = [bloat_target(path, size_bytes, file_count) for path in paths]
+        return ScanResult(
+            root_path=Path("/project"), targets=targets, total_size=size_bytes * len(targets)
+        )
+
+    return make
+
+
 @pytest.fixture
 def mock_project(temp_dir: Path):
     """Create a mock project structure with bloat."""
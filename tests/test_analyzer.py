@@ -0,0 +1,52 @@
+"""Tests for the analyzer module."""
+
+from __future__ import annotations
+
+from rich.console import Console
+
+from bloat_hunter.core.analyzer import PLAIN_ROWS_THRESHOLD, Analyzer
+
+
+def _paths(count: int) -> list[str]:
+    return [f"/project/[{i}]/node_modules" for i in range(count)]
+
+
+class TestDisplayResults:
+    """Tests for Analyzer.display_results."""
+
+    def test_small_result_uses_table(self, scan_result):
+        """Results under the threshold should render as a Rich table."""
+        console = Console(record=True, width=120)
+        Analyzer(console=console).display_results(scan_result(*_paths(3)), show_all=True)
+
+        output = console.export_text()
+        assert "┃ #" in output
+        assert "node_modules" in output
+
+    def test_large_result_prints_plain_rows(self, scan_result):
+        """Non-terminal results over the threshold should print one plain line per target."""
+        count = PLAIN_ROWS_THRESHOLD + 1
+        console = Console(record=True, width=120, force_terminal=False)
+        Analyzer(console=console).display_results(scan_result(*_paths(count)), show_all=True)
+
+        lines = console.export_text().splitlines()
+        assert not any("┃" in line for line in lines)
+        assert any("printing plain text" in line for line in lines)
+        rows = [line for line in lines if line.endswith("/node_modules")]
+        assert len(rows) == count
+        # Paths are printed verbatim, not parsed as markup
+        assert rows[0].endswith("/project/[0]/node_modules")
+        # Size stays right-justified, so its column ends at the same offset
+        header = next(line for line in lines if line.startswith("#"))
+        size_end = header.index("Size") + len("Size")
+        assert rows[0][:size_end].endswith("KB")
+
+    def test_large_result_on_terminal_uses_table(self, scan_result):
+        """Terminals should get the Rich table however many rows there are."""
+        count = PLAIN_ROWS_THRESHOLD + 1
+        console = Console(record=True, width=120, force_terminal=True)
+        Analyzer(console=console).display_results(scan_result(*_paths(count)), show_all=True)
+
+        output = console.export_text()
+        assert "┃ #" in output
+        assert "printing plain text" not in output
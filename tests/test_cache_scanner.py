@@ -216,6 +216,32 @@ class TestCacheScanner:
                     sizes = [t.size_bytes for t in result.targets]
                     assert sizes == sorted(sizes, reverse=True)
 
+    def test_overlapping_roots_report_each_path_once(self, mock_cache_structure: Path):
+        """A path reachable from two cache roots should be sized and listed once."""
+        with patch("bloat_hunter.core.cache_scanner.get_platform_info") as mock_platform:
+            mock_platform.return_value = PlatformInfo(
+                name="Linux",
+                variant="Test",
+                home_dir=mock_cache_structure,
+            )
+
+            cache_paths = {
+                "system": [mock_cache_structure / ".cache"],
+                "browser": [],
+                "package_managers": [],
+                "apps": [mock_cache_structure / ".cache"],
+            }
+
+            with patch("bloat_hunter.core.cache_scanner.get_all_cache_paths") as mock_cache:
+                mock_cache.return_value = cache_paths
+
+                result = CacheScanner().scan()
+
+                paths = [t.path for t in result.targets]
+                assert paths
+                assert len(paths) == len(set(paths))
+                assert result.total_size == sum(t.size_bytes for t in result.targets)
+
     def test_categories_tracked(self, mock_cache_structure: Path):
         """Test that scanned categories are tracked."""
         with patch("bloat_hunter.core.cache_scanner.get_platform_info") as mock_platform:
@@ -0,0 +1,83 @@
+"""Tests for the cleaner module."""
+
+from __future__ import annotations
+
+from pathlib import Path
+
+from rich.console import Console
+
+from bloat_hunter.core.cleaner import TRASH_BATCH_SIZE, Cleaner
+
+
+class TestCleaner:
+    """Tests for Cleaner."""
+
+    def test_permanent_delete(self, temp_dir: Path, bloat_target):
+        """Files and directories should be removed without trash."""
+        file = temp_dir / "file.bin"
+        file.write_bytes(b"x" * 10)
+        directory = temp_dir / "node_modules"
+        directory.mkdir()
+        (directory / "pkg.js").write_text("x")
+
+        cleaner = Cleaner(console=Console(quiet=True), use_trash=False)
+        success, failure = cleaner.clean([bloat_target(file, 10), bloat_target(directory, 1)])
+
+        assert (success, failure) == (2, 0)
+        assert not file.exists()
+        assert not directory.exists()
+
+    def test_permanent_delete_removes_symlink_not_target(self, temp_dir: Path, bloat_target):
+        """A symlinked directory should be unlinked, leaving its target intact."""
+        real = temp_dir / "real"
+        real.mkdir()
+        (real / "keep.txt").write_text("x")
+        link = temp_dir / "link"
+        link.symlink_to(real, target_is_directory=True)
+
+        cleaner = Cleaner(console=Console(quiet=True), use_trash=False)
+        success, failure = cleaner.clean([bloat_target(link, 1)])
+
+        assert (success, failure) == (1, 0)
+        assert not link.is_symlink()
+        assert (real / "keep.txt").exists()
+
+    def test_trash_is_batched(self, temp_dir: Path, bloat_target):
+        """Trashed paths should be sent in batches, not one call per path."""
+        calls: list[list[str]] = []
+        files = []
+        for i in range(TRASH_BATCH_SIZE + 1):
+            file = temp_dir / f"f{i}.bin"
+            file.write_bytes(b"x")
+            files.append(file)
+
+        cleaner = Cleaner(console=Console(quiet=True), use_trash=True)
+        cleaner._send2trash = calls.append
+        success, failure = cleaner.clean([bloat_target(f, 1) for f in files])
+
+        assert (success, failure) == (len(files), 0)
+        assert [len(batch) for batch in calls] == [TRASH_BATCH_SIZE, 1]
+
+    def test_trash_fallback_tolerates_missing_path(self, temp_dir: Path):
+        """Retrying a path that is already gone should not raise."""
+        gone = temp_dir / "gone"
+
+        def failing_trash(paths):
+            raise OSError("trash unavailable")
+
+        cleaner = Cleaner(console=Console(quiet=True), use_trash=True)
+        cleaner._send2trash = failing_trash
+        cleaner._delete_path(gone)
+
+        assert not gone.exists()
+
+    def test_refuses_protected_path(self, bloat_target):
+        """Protected paths should be counted as failures and left alone."""
+        calls: list[object] = []
+
+        cleaner = Cleaner(console=Console(quiet=True), use_trash=True)
+        cleaner._send2trash = calls.append
+        success, failure = cleaner.clean([bloat_target(Path.home())])
+
+        assert (success, failure) == (0, 1)
+        assert calls == []
@@ -40,6 +40,13 @@ class TestDefaultsConfig:
         assert config.trash is False
         assert config.interactive is True  # default
 
+    def test_frozen(self):
+        from dataclasses import FrozenInstanceError
+
+        config = DefaultsConfig()
+        with pytest.raises(FrozenInstanceError):
+            config.dry_run = False  # type: ignore[misc]
+
 
 class TestPackagesConfig:
     """Tests for PackagesConfig dataclass."""
@@ -138,6 +145,13 @@ class TestMergeDicts:
         _merge_dicts(base, override)
         assert base == {"a": 1}  # Original unchanged
 
+    def test_nested_base_unchanged(self):
+        base = {"section": {"inner": {"a": 1}}}
+        override = {"section": {"inner": {"a": 2, "b": 3}}}
+        result = _merge_dicts(base, override)
+        assert result == {"section": {"inner": {"a": 2, "b": 3}}}
+        assert base == {"section": {"inner": {"a": 1}}}
+
 
 class TestValidateConfig:
     """Tests for _validate_config function."""
@@ -193,6 +207,12 @@ class TestDictToConfig:
         config = _dict_to_config({}, source=path)
         assert config._source == path
 
+    def test_unknown_keys_dropped(self):
+        data = {"scan": {"deep": True, "not_a_setting": 1}}
+        config = _dict_to_config(data)
+        assert config.scan.deep is True
+        assert not hasattr(config.scan, "not_a_setting")
+
 
 class TestGetConfigPaths:
     """Tests for get_config_paths function."""
@@ -211,17 +231,27 @@ class TestGetConfigPaths:
         _, cwd = get_config_paths()
         assert cwd.name == "bloathunter.toml"
 
+    def test_cached_until_cleared(self, monkeypatch, tmp_path):
+        first = get_config_paths()
+        monkeypatch.chdir(tmp_path)
+        assert get_config_paths() is first
+
+        get_config_paths.cache_clear()
+        assert get_config_paths()[1] == tmp_path / "bloathunter.toml"
+
 
 class TestGetXdgConfigHome:
     """Tests for get_xdg_config_home function."""
 
     def test_default_path(self, monkeypatch):
         monkeypatch.delenv("XDG_CONFIG_HOME", raising=False)
+        get_xdg_config_home.cache_clear()
         result = get_xdg_config_home()
         assert result == Path.home() / ".config"
 
     def test_custom_xdg(self, monkeypatch):
         monkeypatch.setenv("XDG_CONFIG_HOME", "/custom/config")
+        get_xdg_config_home.cache_clear()
         result = get_xdg_config_home()
         assert result == Path("/custom/config")
 
@@ -233,9 +263,47 @@ class TestLoadConfig:
         # Ensure no config files exist
         monkeypatch.chdir(tmp_path)
         monkeypatch.setenv("XDG_CONFIG_HOME", str(tmp_path / "nonexistent"))
+        get_xdg_config_home.cache_clear()
+        get_config_paths.cache_clear()
         config = load_config()
         assert config._source is None
         assert config.defaults.dry_run is True  # Default
+        assert load_config() is config  # Shared defaults, not rebuilt
+
+    def test_cwd_config_overrides(self, monkeypatch, tmp_path):
+        monkeypatch.chdir(tmp_path)
+        monkeypatch.setenv("XDG_CONFIG_HOME", str(tmp_path / "nonexistent"))
+        get_xdg_config_home.cache_clear()
+        get_config_paths.cache_clear()
+        (tmp_path / "bloathunter.toml").write_text("[defaults]\ndry_run = false\n")
+        config = load_config()
+        assert config._source == tmp_path / "bloathunter.toml"
+        assert config.defaults.dry_run is False
+
+    def test_reloads_when_file_changes(self, monkeypatch, tmp_path):
+        monkeypatch.chdir(tmp_path)
+        monkeypatch.setenv("XDG_CONFIG_HOME", str(tmp_path / "nonexistent"))
+        get_xdg_config_home.cache_clear()
+        get_config_paths.cache_clear()
+        config_file = tmp_path / "bloathunter.toml"
+        config_file.write_text("[defaults]\ndry_run = false\n")
+
+        config = load_config()
+        assert load_config() is config  # Unchanged file is not re-parsed
+
+        config_file.write_text("[defaults]\ndry_run = true\ntrash = false\n")
+        reloaded = load_config()
+        assert reloaded is not config
+        assert reloaded.defaults.trash is False
+
+    def test_invalid_toml(self, monkeypatch, tmp_path):
+        monkeypatch.chdir(tmp_path)
+        monkeypatch.setenv("XDG_CONFIG_HOME", str(tmp_path / "nonexistent"))
+        get_xdg_config_home.cache_clear()
+        get_config_paths.cache_clear()
+        (tmp_path / "bloathunter.toml").write_text("[defaults\n")
+        with pytest.raises(ValueError, match="Invalid TOML"):
+            load_config()
 
 
 class TestLoadConfigFromFile:
@@ -272,6 +340,12 @@ keep = "invalid"
         with pytest.raises(ValueError, match="duplicates.keep"):
             load_config_from_file(config_file)
 
+    def test_load_invalid_toml(self, tmp_path):
+        config_file = tmp_path / "test.toml"
+        config_file.write_text("[defaults\n")
+        with pytest.raises(ValueError, match="Invalid TOML"):
+            load_config_from_file(config_file)
+
 
 class TestDefaultConfigTemplate:
     """Tests for DEFAULT_CONFIG_TEMPLATE."""
@@ -6,13 +6,17 @@ from pathlib import Path
 
 import pytest
 from bloat_hunter.core.duplicates import (
+    CHUNK_SIZE,
+    MMAP_THRESHOLD,
+    PARTIAL_SIZE,
     DuplicateFile,
     DuplicateGroup,
     DuplicateResult,
     DuplicateScanner,
     hash_file,
+    hash_file_partial,
 )
-from bloat_hunter.core.scanner import parse_size
+from bloat_hunter.core.sizes import parse_size
 
 
 class TestHashFile:
@@ -60,6 +64,50 @@ class TestHashFile:
         result = hash_file(file)
         assert result is not None
 
+    def test_hash_is_128_bit(self, temp_dir: Path):
+        """Hashes should be 128-bit hex digests."""
+        file = temp_dir / "file.bin"
+        file.write_bytes(b"x" * 100)
+
+        result = hash_file(file)
+        assert result is not None
+        assert len(result) == 32
+
+    def test_hash_spans_multiple_chunks(self, temp_dir: Path):
+        """Files larger than one read chunk differ by their tail bytes."""
+        file1 = temp_dir / "a.bin"
+        file2 = temp_dir / "b.bin"
+        file1.write_bytes(b"x" * (CHUNK_SIZE * 2) + b"a")
+        file2.write_bytes(b"x" * (CHUNK_SIZE * 2) + b"b")
+
+        assert hash_file(file1) != hash_file(file2)
+
+    def test_mmap_path_detects_tail_difference(self, temp_dir: Path):
+        """Memory-mapped hashing should detect single-byte tail differences."""
+        file1 = temp_dir / "a.bin"
+        file2 = temp_dir / "b.bin"
+        file1.write_bytes(b"x" * MMAP_THRESHOLD + b"a")
+        file2.write_bytes(b"x" * MMAP_THRESHOLD + b"b")
+
+        assert hash_file(file1) != hash_file(file2)
+
+    def test_partial_hash_equals_full_hash_for_small_file(self, temp_dir: Path):
+        """Files within both partial windows hash identically either way."""
+        file = temp_dir / "small.bin"
+        file.write_bytes(b"y" * PARTIAL_SIZE + b"z" * (PARTIAL_SIZE - 1))
+
+        assert hash_file_partial(file, 2 * PARTIAL_SIZE - 1) == hash_file(file)
+
+    def test_partial_hash_covers_tail(self, temp_dir: Path):
+        """Large files differing only in their last bytes get different partial hashes."""
+        size = 4 * PARTIAL_SIZE
+        file1 = temp_dir / "a.bin"
+        file2 = temp_dir / "b.bin"
+        file1.write_bytes(b"x" * (size - 1) + b"a")
+        file2.write_bytes(b"x" * (size - 1) + b"b")
+
+        assert hash_file_partial(file1, size) != hash_file_partial(file2, size)
+
 
 class TestDuplicateGroup:
     """Tests for DuplicateGroup dataclass."""
@@ -149,6 +197,18 @@ class TestDuplicateGroup:
         assert Path("/b.txt") in paths
         assert Path("/c.txt") in paths
 
+    def test_get_duplicates_to_remove_keeps_middle_file(self):
+        """Removing around a kept file in the middle should keep the others in order."""
+        files = [
+            DuplicateFile(path=Path("/a.txt"), size_bytes=1000, mtime=2.0),
+            DuplicateFile(path=Path("/b.txt"), size_bytes=1000, mtime=1.0),
+            DuplicateFile(path=Path("/c.txt"), size_bytes=1000, mtime=3.0),
+        ]
+        group = DuplicateGroup(hash_value="abc", size_bytes=1000, files=files)
+
+        to_remove = group.get_duplicates_to_remove("oldest")
+        assert [f.path for f in to_remove] == [Path("/a.txt"), Path("/c.txt")]
+
 
 class TestDuplicateScanner:
     """Tests for DuplicateScanner."""
@@ -231,6 +291,20 @@ class TestDuplicateScanner:
         # Larger files should be first
         assert result.groups[0].size_bytes > result.groups[1].size_bytes
 
+    def test_same_ends_different_middle(self, temp_dir: Path):
+        """Files sharing both ends but differing in the middle are not duplicates."""
+        ends = b"p" * (PARTIAL_SIZE * 2)
+        (temp_dir / "a.bin").write_bytes(ends + b"a" + ends)
+        (temp_dir / "b.bin").write_bytes(ends + b"b" + ends)
+        (temp_dir / "c.bin").write_bytes(ends + b"a" + ends)
+
+        scanner = DuplicateScanner(min_size=0)
+        result = scanner.scan(temp_dir)
+
+        assert len(result.groups) == 1
+        names = sorted(f.path.name for f in result.groups[0].files)
+        assert names == ["a.bin", "c.bin"]
+
 
 class TestParseSize:
     """Tests for parse_size utility."""
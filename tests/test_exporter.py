@@ -0,0 +1,96 @@
+"""Tests for the exporter module."""
+
+from __future__ import annotations
+
+import csv
+import json
+from pathlib import Path
+
+import pytest
+
+from bloat_hunter.core import exporter
+from bloat_hunter.core.duplicates import DuplicateFile, DuplicateGroup, DuplicateResult
+from bloat_hunter.core.exporter import export_csv, export_json
+from bloat_hunter.core.scanner import ScanResult
+
+
+@pytest.fixture
+def cafe_result(scan_result) -> ScanResult:
+    return scan_result("/project/café/node_modules", size_bytes=2048, file_count=3)
+
+
+class TestExportJson:
+    """Tests for export_json."""
+
+    @pytest.mark.parametrize("use_orjson", [True, False])
+    def test_round_trip(
+        self,
+        temp_dir: Path,
+        cafe_result: ScanResult,
+        monkeypatch: pytest.MonkeyPatch,
+        use_orjson: bool,
+    ):
+        """Both the orjson and stdlib writers should produce the same UTF-8 JSON."""
+        if use_orjson and exporter._orjson_dumps is None:
+            pytest.skip("orjson not installed")
+        if not use_orjson:
+            monkeypatch.setattr(exporter, "_orjson_dumps", None)
+
+        output = temp_dir / "result.json"
+        export_json(cafe_result, output)
+
+        text = output.read_text(encoding="utf-8")
+        assert "café" in text  # Not \\u-escaped
+        data = json.loads(text)
+        assert data["type"] == "scan"
+        assert data["total_size_bytes"] == 2048
+        assert data["targets"][0]["path"] == "/project/café/node_modules"
+
+
+class TestExportCsv:
+    """Tests for export_csv."""
+
+    def test_targets(self, temp_dir: Path, cafe_result: ScanResult):
+        """Target rows should follow the header columns."""
+        output = temp_dir / "result.csv"
+        export_csv(cafe_result, output)
+
+        with open(output, encoding="utf-8", newline="") as f:
+            rows = list(csv.DictReader(f))
+        assert rows == [
+            {
+                "path": "/project/café/node_modules",
+                "category": "JavaScript",
+                "pattern_name": "node_modules",
+                "size_bytes": "2048",
+                "size_human": cafe_result.targets[0].size_human,
+                "file_count": "3",
+            }
+        ]
+
+    def test_duplicates(self, temp_dir: Path):
+        """Each duplicate file should get a row carrying its group's columns."""
+        files = [
+            DuplicateFile(path=Path("/a.bin"), size_bytes=100, mtime=1.0),
+            DuplicateFile(path=Path("/b.bin"), size_bytes=100, mtime=2.0),
+        ]
+        group = DuplicateGroup(hash_value="abc", size_bytes=100, files=files)
+        result = DuplicateResult(root_path=Path("/"), groups=[group], total_wasted=100)
+
+        output = temp_dir / "dupes.csv"
+        export_csv(result, output)
+
+        with open(output, encoding="utf-8", newline="") as f:
+            rows = list(csv.reader(f))
+        assert rows == [
+            [
+                "group_hash",
+                "group_size_bytes",
+                "group_wasted_bytes",
+                "duplicate_count",
+                "file_path",
+                "file_mtime",
+            ],
+            ["abc", "100", "100", "1", "/a.bin", "1.0"],
+            ["abc", "100", "100", "1", "/b.bin", "2.0"],
+        ]
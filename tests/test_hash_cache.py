@@ -0,0 +1,245 @@
+"""Tests for the persistent file hash cache."""
+
+from __future__ import annotations
+
+import dbm
+import os
+import time
+from concurrent.futures import ThreadPoolExecutor
+from pathlib import Path
+
+import pytest
+
+from bloat_hunter.core.duplicates import HASH_ALGORITHM, PARTIAL_SIZE, DuplicateScanner
+from bloat_hunter.core.hash_cache import HASH_CACHE_MAX_AGE_DAYS, HashCache, get_hash_cache_path
+
+DAY = 86400
+
+
+def _days_later(monkeypatch: pytest.MonkeyPatch, days: int) -> None:
+    """Make the hash cache see a clock the given number of days ahead."""
+    now = time.time() + days * DAY
+    monkeypatch.setattr("bloat_hunter.core.hash_cache.time.time", lambda: now)
+
+
+class TestHashCache:
+    """Tests for HashCache."""
+
+    def test_round_trip(self, temp_dir: Path):
+        """Hashes should survive closing and reopening the cache."""
+        cache_path = temp_dir / "cache" / "dedup"
+        file = temp_dir / "file.bin"
+        file.write_bytes(b"x" * 100)
+
+        with HashCache(cache_path) as cache:
+            cache.put(file, file.stat(), "abc")
+
+        with HashCache(cache_path) as cache:
+            assert cache.get(file, file.stat()) == "abc"
+
+    def test_changed_file_misses(self, temp_dir: Path):
+        """A different size or mtime should not return the stale hash."""
+        cache_path = temp_dir / "cache" / "dedup"
+        file = temp_dir / "file.bin"
+        file.write_bytes(b"x" * 100)
+
+        with HashCache(cache_path) as cache:
+            cache.put(file, file.stat(), "abc")
+
+        file.write_bytes(b"x" * 200)
+        with HashCache(cache_path) as cache:
+            assert cache.get(file, file.stat()) is None
+
+    def test_edit_with_restored_mtime_misses(self, temp_dir: Path):
+        """An in-place edit should miss even if size and mtime are restored."""
+        cache_path = temp_dir / "cache" / "dedup"
+        file = temp_dir / "file.bin"
+        file.write_bytes(b"a" * 100)
+        before = file.stat()
+
+        with HashCache(cache_path) as cache:
+            cache.put(file, before, "abc")
+
+        file.write_bytes(b"b" * 100)
+        os.utime(file, ns=(before.st_atime_ns, before.st_mtime_ns))
+        after = file.stat()
+        assert (after.st_size, after.st_mtime_ns) == (before.st_size, before.st_mtime_ns)
+
+        with HashCache(cache_path) as cache:
+            assert cache.get(file, after) is None
+
+    def test_full_and_partial_hashes_are_separate(self, temp_dir: Path):
+        """Full and partial hashes for the same file should not overwrite each other."""
+        cache_path = temp_dir / "cache" / "dedup"
+        file = temp_dir / "a.bin"
+        file.write_bytes(b"x" * 10)
+        stat = file.stat()
+
+        with HashCache(cache_path) as cache:
+            cache.put(file, stat, "partial")
+            cache.put(file, stat, "full", full=True)
+
+        with HashCache(cache_path) as cache:
+            assert cache.get(file, stat) == "partial"
+            assert cache.get(file, stat, full=True) == "full"
+
+    def test_get_from_worker_thread(self, temp_dir: Path):
+        """Lookups from pool threads should hit, whichever dbm backend is in use."""
+        cache_path = temp_dir / "cache" / "dedup"
+        file = temp_dir / "file.bin"
+        file.write_bytes(b"x" * 100)
+
+        with HashCache(cache_path) as cache:
+            cache.put(file, file.stat(), "abc")
+
+        with HashCache(cache_path) as cache, ThreadPoolExecutor(max_workers=2) as pool:
+            assert pool.submit(cache.get, file, file.stat()).result() == "abc"
+
+    def test_unused_entries_expire(self, temp_dir: Path, monkeypatch: pytest.MonkeyPatch):
+        """Entries not used for HASH_CACHE_MAX_AGE_DAYS should be dropped on close."""
+        cache_path = temp_dir / "cache" / "dedup"
+        file = temp_dir / "file.bin"
+        file.write_bytes(b"x" * 100)
+
+        with HashCache(cache_path) as cache:
+            cache.put(file, file.stat(), "abc")
+            cache.put(file, file.stat(), "full", full=True)
+
+        _days_later(monkeypatch, HASH_CACHE_MAX_AGE_DAYS + 1)
+        with HashCache(cache_path):
+            pass
+
+        with HashCache(cache_path) as cache:
+            assert cache.get(file, file.stat()) is None
+            assert cache.get(file, file.stat(), full=True) is None
+
+    def test_prunes_at_most_once_a_day(self, temp_dir: Path, monkeypatch: pytest.MonkeyPatch):
+        """Only the first close() of a day should walk the store for expired entries."""
+        cache_path = temp_dir / "cache" / "dedup"
+        with HashCache(cache_path):
+            pass  # Today's prune
+
+        with dbm.open(str(cache_path), "w") as db:
+            db[b"/gone.bin"] = b"1:0:0:0:0:0:abc"  # Last used in 1970
+
+        with HashCache(cache_path):
+            pass
+        with dbm.open(str(cache_path), "r") as db:
+            assert b"/gone.bin" in db
+
+        _days_later(monkeypatch, 1)
+        with HashCache(cache_path):
+            pass
+        with dbm.open(str(cache_path), "r") as db:
+            assert b"/gone.bin" not in db
+
+    def test_used_entries_are_kept(self, temp_dir: Path, monkeypatch: pytest.MonkeyPatch):
+        """Reading an entry should reset its age."""
+        cache_path = temp_dir / "cache" / "dedup"
+        file = temp_dir / "file.bin"
+        file.write_bytes(b"x" * 100)
+
+        with HashCache(cache_path) as cache:
+            cache.put(file, file.stat(), "abc")
+
+        _days_later(monkeypatch, HASH_CACHE_MAX_AGE_DAYS - 1)
+        with HashCache(cache_path) as cache:
+            assert cache.get(file, file.stat()) == "abc"
+
+        _days_later(monkeypatch, 2 * HASH_CACHE_MAX_AGE_DAYS - 2)
+        with HashCache(cache_path) as cache:
+            assert cache.get(file, file.stat()) == "abc"
+
+    def test_unknown_file_misses(self, temp_dir: Path):
+        """Files never recorded should miss."""
+        file = temp_dir / "unknown.bin"
+        file.write_bytes(b"x")
+        with HashCache(temp_dir / "cache" / "dedup") as cache:
+            assert cache.get(file, file.stat()) is None
+
+
+class TestDuplicateScannerWithCache:
+    """Tests for DuplicateScanner using a HashCache."""
+
+    def test_cached_scan_matches_uncached(self, temp_dir: Path):
+        """Scanning with a warm cache should find the same duplicates."""
+        data = temp_dir / "data"
+        data.mkdir()
+        (data / "a.bin").write_bytes(b"same" * 100)
+        (data / "b.bin").write_bytes(b"same" * 100)
+        (data / "c.bin").write_bytes(b"diff" * 100)
+        cache_path = temp_dir / "cache" / "dedup"
+
+        for _ in range(2):
+            with HashCache(cache_path) as cache:
+                result = DuplicateScanner(min_size=0, hash_cache=cache).scan(data)
+
+            assert len(result.groups) == 1
+            names = sorted(f.path.name for f in result.groups[0].files)
+            assert names == ["a.bin", "b.bin"]
+
+        with HashCache(cache_path) as cache:
+            assert cache.get(data / "a.bin", (data / "a.bin").stat()) is not None
+
+    def test_full_hashes_are_cached(self, temp_dir: Path):
+        """Files needing a full hash should have it recorded for the next run."""
+        data = temp_dir / "data"
+        data.mkdir()
+        content = b"x" * (3 * PARTIAL_SIZE)
+        (data / "a.bin").write_bytes(content)
+        (data / "b.bin").write_bytes(content)
+        cache_path = temp_dir / "cache" / "dedup"
+
+        with HashCache(cache_path) as cache:
+            DuplicateScanner(min_size=0, hash_cache=cache).scan(data)
+
+        with HashCache(cache_path) as cache:
+            assert cache.get(data / "a.bin", (data / "a.bin").stat(), full=True)
+
+    def _edit_keeping_mtime(self, path: Path, offset: int) -> None:
+        """Flip one byte of a file in place, then restore its atime and mtime."""
+        before = path.stat()
+        with open(path, "r+b") as f:
+            f.seek(offset)
+            byte = f.read(1)
+            f.seek(offset)
+            f.write(bytes([byte[0] ^ 0xFF]))
+        os.utime(path, ns=(before.st_atime_ns, before.st_mtime_ns))
+
+    def test_edit_with_restored_mtime_is_rehashed(self, temp_dir: Path):
+        """A file edited in the middle with its mtime restored is no longer a duplicate."""
+        data = temp_dir / "data"
+        data.mkdir()
+        content = b"x" * 300_000
+        (data / "a.bin").write_bytes(content)
+        (data / "b.bin").write_bytes(content)
+        cache_path = temp_dir / "cache" / "dedup"
+
+        with HashCache(cache_path) as cache:
+            assert len(DuplicateScanner(min_size=0, hash_cache=cache).scan(data).groups) == 1
+
+        self._edit_keeping_mtime(data / "b.bin", 150_000)
+
+        with HashCache(cache_path) as cache:
+            assert DuplicateScanner(min_size=0, hash_cache=cache).scan(data).groups == []
+
+    def test_small_file_edit_with_restored_mtime_is_rehashed(self, temp_dir: Path):
+        """Files settled by their partial hash alone must also see in-place edits."""
+        data = temp_dir / "data"
+        data.mkdir()
+        content = b"x" * PARTIAL_SIZE
+        (data / "a.bin").write_bytes(content)
+        (data / "b.bin").write_bytes(content)
+        cache_path = temp_dir / "cache" / "dedup"
+
+        with HashCache(cache_path) as cache:
+            assert len(DuplicateScanner(min_size=0, hash_cache=cache).scan(data).groups) == 1
+
+        self._edit_keeping_mtime(data / "b.bin", PARTIAL_SIZE // 2)
+
+        with HashCache(cache_path) as cache:
+            assert DuplicateScanner(min_size=0, hash_cache=cache).scan(data).groups == []
+
+    def test_default_path_is_per_algorithm(self):
+        """Digests from different hash algorithms should never share a cache."""
+        assert get_hash_cache_path().name.endswith(f"-{HASH_ALGORITHM}")
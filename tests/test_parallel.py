@@ -11,6 +11,7 @@ from bloat_hunter.core.parallel import (
     get_directory_sizes_parallel,
     parallel_map,
     parallel_map_ordered,
+    parallel_walk,
 )
 
 
@@ -119,6 +120,25 @@ class TestParallelMap:
         assert len(results) == 8
         assert parallel_time < 0.3  # Should be much faster than 400ms
 
+    def test_consumes_iterable_lazily(self) -> None:
+        """Test that only a bounded window of items is pulled ahead of results."""
+        pulled = 0
+
+        def items():
+            nonlocal pulled
+            for i in range(100):
+                pulled += 1
+                yield i
+
+        config = ParallelConfig(enabled=True, max_workers=2)
+        results = parallel_map(lambda x: x, items(), config)
+
+        next(results)
+        assert pulled < 100
+
+        remaining = list(results)
+        assert len(remaining) == 99
+
 
 class TestParallelMapOrdered:
     """Tests for parallel_map_ordered function."""
@@ -166,6 +186,47 @@ class TestParallelMapOrdered:
         assert results[2] == (3, 3, None)
 
 
+class TestParallelWalk:
+    """Tests for parallel_walk function."""
+
+    @staticmethod
+    def expand(n: int) -> tuple[list[int], int]:
+        # Binary tree of node ids below 15
+        children = [c for c in (2 * n + 1, 2 * n + 2) if c < 15]
+        return children, n * 10
+
+    def test_visits_all_nodes(self) -> None:
+        """Test that every node in the tree is processed once."""
+        config = ParallelConfig(enabled=True, max_workers=4)
+        results = list(parallel_walk(self.expand, [0], config))
+
+        assert sorted(item for item, _, _ in results) == list(range(15))
+        assert all(result == item * 10 for item, result, _ in results)
+
+    def test_disabled_parallel(self) -> None:
+        """Test sequential depth-first walk when parallel is disabled."""
+        config = ParallelConfig(enabled=False)
+        results = list(parallel_walk(self.expand, [0], config))
+
+        assert [item for item, _, _ in results][:4] == [0, 1, 3, 7]
+        assert len(results) == 15
+
+    def test_error_skips_children(self) -> None:
+        """Test that a failing node is reported and its subtree skipped."""
+        def expand(n: int) -> tuple[list[int], int]:
+            if n == 1:
+                raise PermissionError("denied")
+            return self.expand(n)
+
+        results = list(parallel_walk(expand, [0]))
+        items = {item for item, _, _ in results}
+
+        errors = [(item, error) for item, _, error in results if error is not None]
+        assert len(errors) == 1
+        assert errors[0][0] == 1
+        assert items == {0, 1, 2, 5, 6, 11, 12, 13, 14}
+
+
 class TestGetDirectorySizesParallel:
     """Tests for get_directory_sizes_parallel function."""
 
@@ -2,9 +2,12 @@
 
 from __future__ import annotations
 
+import dataclasses
 import platform
 from pathlib import Path
 
+import pytest
+
 from bloat_hunter.platform.detect import PlatformInfo, get_platform_info
 
 
@@ -35,3 +38,11 @@ class TestGetPlatformInfo:
             assert info.name == "macOS"
         elif system == "Linux":
             assert info.name == "Linux"
+
+    def test_result_is_cached(self):
+        assert get_platform_info() is get_platform_info()
+
+    def test_platform_info_is_frozen(self):
+        info = get_platform_info()
+        with pytest.raises(dataclasses.FrozenInstanceError):
+            info.name = "Other"  # type: ignore[misc]
@@ -4,7 +4,7 @@ from __future__ import annotations
 
 from pathlib import Path
 
-from bloat_hunter.safety.protected import is_protected_path
+from bloat_hunter.safety.protected import is_protected_path, is_protected_scan_path
 
 
 class TestIsProtectedPath:
@@ -56,3 +56,27 @@ class TestIsProtectedPath:
         cache = project / "__pycache__"
         cache.mkdir()
         assert is_protected_path(cache) is False
+
+
+class TestIsProtectedScanPath:
+    """Tests for is_protected_scan_path function."""
+
+    def test_matches_is_protected_path(self, temp_dir: Path):
+        """String checks should agree with is_protected_path for scanning."""
+        paths = [
+            Path("/"),
+            Path("/etc"),
+            Path("/usr/lib/python3"),
+            Path("/usr/lib/__pycache__"),
+            temp_dir / ".ssh",
+            temp_dir / "node_modules",
+        ]
+        for path in paths:
+            expected = is_protected_path(path, for_scanning=True)
+            assert is_protected_scan_path(str(path)) is expected, path
+
+    def test_project_root_not_skipped(self, temp_dir: Path):
+        """Project roots are only protected from deletion, not scanning."""
+        (temp_dir / "pyproject.toml").write_text("")
+
+        assert is_protected_scan_path(str(temp_dir)) is False
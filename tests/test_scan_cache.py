@@ -0,0 +1,129 @@
+"""Tests for the scan result cache."""
+
+from __future__ import annotations
+
+import json
+import os
+import shutil
+from pathlib import Path
+
+import pytest
+
+from bloat_hunter.core.scan_cache import (
+    SCAN_CACHE_TTL,
+    clear_scan_result,
+    get_scan_cache_path,
+    load_scan_result,
+    save_scan_result,
+)
+from bloat_hunter.core.scanner import Scanner
+
+
+@pytest.fixture
+def cache_home(temp_dir: Path, monkeypatch: pytest.MonkeyPatch) -> Path:
+    """Point XDG_CACHE_HOME at a temporary directory."""
+    cache = temp_dir / "xdg-cache"
+    monkeypatch.setenv("XDG_CACHE_HOME", str(cache))
+    return cache
+
+
+class TestScanCache:
+    """Tests for saving and loading cached scan results."""
+
+    def test_round_trip(self, mock_project: Path, cache_home: Path):
+        """A fresh cached result should load back with the same targets."""
+        result = Scanner().scan(mock_project, deep=True)
+        cache_path = get_scan_cache_path(mock_project, True, 0)
+        save_scan_result(result, cache_path)
+
+        loaded = load_scan_result(mock_project, cache_path)
+
+        assert loaded is not None
+        cached, age = loaded
+        assert 0 <= age < SCAN_CACHE_TTL
+        assert [(t.path, t.pattern.name, t.size_bytes) for t in cached.targets] == [
+            (t.path, t.pattern.name, t.size_bytes) for t in result.targets
+        ]
+        assert cached.total_size == result.total_size
+
+    def test_options_change_cache_path(self, mock_project: Path, cache_home: Path):
+        """Different scan options should not share a cache entry."""
+        base = get_scan_cache_path(mock_project, True, 0)
+
+        assert get_scan_cache_path(mock_project, False, 0) != base
+        assert get_scan_cache_path(mock_project, True, 1024) != base
+        assert get_scan_cache_path(mock_project, True, 0, frozenset({"vendor"})) != base
+
+    def test_expired_result_is_ignored(self, mock_project: Path, cache_home: Path):
+        """Results older than the TTL should not be reused."""
+        cache_path = get_scan_cache_path(mock_project, True, 0)
+        save_scan_result(Scanner().scan(mock_project, deep=True), cache_path)
+
+        payload = json.loads(cache_path.read_text())
+        payload["created"] -= SCAN_CACHE_TTL + 1
+        cache_path.write_text(json.dumps(payload))
+
+        assert load_scan_result(mock_project, cache_path) is None
+
+    def test_root_change_invalidates(self, mock_project: Path, cache_home: Path):
+        """Adding an entry to the root should invalidate the cached result."""
+        cache_path = get_scan_cache_path(mock_project, True, 0)
+        save_scan_result(Scanner().scan(mock_project, deep=True), cache_path)
+
+        (mock_project / "new_file.txt").write_text("x")
+
+        assert load_scan_result(mock_project, cache_path) is None
+
+    def test_target_change_invalidates(self, mock_project: Path, cache_home: Path):
+        """A change inside a target, below the root, should invalidate the result."""
+        cache_path = get_scan_cache_path(mock_project, True, 0)
+        save_scan_result(Scanner().scan(mock_project, deep=True), cache_path)
+
+        (mock_project / "node_modules" / "react").mkdir()
+
+        assert load_scan_result(mock_project, cache_path) is None
+
+    def test_target_replaced_by_symlink_invalidates(
+        self, mock_project: Path, temp_dir: Path, cache_home: Path
+    ):
+        """A target swapped for a symlink should invalidate the result."""
+        cache_path = get_scan_cache_path(mock_project, True, 0)
+        save_scan_result(Scanner().scan(mock_project, deep=True), cache_path)
+        root_stat = mock_project.stat()
+
+        elsewhere = temp_dir / "elsewhere"
+        elsewhere.mkdir()
+        shutil.rmtree(mock_project / "node_modules")
+        (mock_project / "node_modules").symlink_to(elsewhere)
+        os.utime(mock_project, ns=(root_stat.st_atime_ns, root_stat.st_mtime_ns))
+
+        assert load_scan_result(mock_project, cache_path) is None
+
+    def test_clear(self, mock_project: Path, cache_home: Path):
+        """Cleared results should no longer load."""
+        cache_path = get_scan_cache_path(mock_project, True, 0)
+        save_scan_result(Scanner().scan(mock_project, deep=True), cache_path)
+
+        clear_scan_result(cache_path)
+
+        assert load_scan_result(mock_project, cache_path) is None
+
+    @pytest.mark.parametrize(
+        "corrupt",
+        [
+            lambda payload: payload.pop("created"),
+            lambda payload: payload.update(total_size=None, created="yesterday"),
+            lambda payload: payload.update(targets=[["only", "three", 1]]),
+            lambda payload: payload.update(targets=None),
+        ],
+    )
+    def test_malformed_result_is_ignored(self, mock_project: Path, cache_home: Path, corrupt):
+        """A damaged cache file with the right version should be ignored, not crash."""
+        cache_path = get_scan_cache_path(mock_project, True, 0)
+        save_scan_result(Scanner().scan(mock_project, deep=True), cache_path)
+
+        payload = json.loads(cache_path.read_text())
+        corrupt(payload)
+        cache_path.write_text(json.dumps(payload))
+
+        assert load_scan_result(mock_project, cache_path) is None
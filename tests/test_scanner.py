@@ -5,7 +5,24 @@ from __future__ import annotations
 from pathlib import Path
 
 import pytest
-from bloat_hunter.core.scanner import Scanner, format_size, get_directory_size, parse_size
+from rich.console import Console
+from rich.progress import Progress
+
+from bloat_hunter.core import scanner as scanner_module
+from bloat_hunter.core.scanner import (
+    Scanner,
+    collect_pattern_matches,
+    format_size,
+    get_directory_size,
+    match_patterns,
+    parse_size,
+    sizing_reporter,
+)
+from bloat_hunter.patterns import (
+    PatternMatcher,
+    get_all_patterns_including_system_caches,
+    get_system_cache_patterns,
+)
 
 
 class TestFormatSize:
@@ -51,6 +68,40 @@ class TestGetDirectorySize:
         assert size == 4
         assert count == 1
 
+    def test_skips_symlinks(self, temp_dir: Path):
+        (temp_dir / "file.txt").write_text("data")
+        (temp_dir / "subdir").mkdir()
+        (temp_dir / "subdir" / "inner.txt").write_text("xy")
+        (temp_dir / "link.txt").symlink_to(temp_dir / "file.txt")
+        (temp_dir / "linkdir").symlink_to(temp_dir / "subdir")
+
+        size, count = get_directory_size(temp_dir)
+        assert size == 6
+        assert count == 2
+
+    def test_deeply_nested_directory(self, temp_dir: Path):
+        # Walk is iterative, so depth is not bounded by the recursion limit
+        current = temp_dir
+        for i in range(50):
+            current = current / f"level{i}"
+        current.mkdir(parents=True)
+        (current / "file.txt").write_text("deep")
+
+        size, count = get_directory_size(temp_dir)
+        assert size == 4
+        assert count == 1
+
+    def test_path_based_walk_matches_fd_walk(self, temp_dir: Path, monkeypatch):
+        # Platforms without fd-based scandir walk by path; results must agree
+        (temp_dir / "a" / "b").mkdir(parents=True)
+        (temp_dir / "a" / "one.txt").write_text("1")
+        (temp_dir / "a" / "b" / "naïve.txt").write_text("22")
+
+        expected = get_directory_size(temp_dir)
+        monkeypatch.setattr(scanner_module, "_SCANDIR_FD", False)
+
+        assert get_directory_size(temp_dir) == expected == (3, 2)
+
 
 class TestScanner:
     """Tests for Scanner class."""
@@ -107,6 +158,139 @@ class TestScanner:
         # Should find at least the node_modules target
         assert len(result.targets) >= 1
 
+    def test_targets_are_slotted(self, mock_project: Path):
+        """Test that targets carry no per-instance __dict__."""
+        result = Scanner().scan(mock_project)
+
+        assert result.targets
+        assert not hasattr(result.targets[0], "__dict__")
+
+    def test_scan_skips_excluded_names(self, mock_project: Path):
+        """Test that excluded directory names are neither reported nor descended."""
+        nested = mock_project / "vendor" / "lib" / "__pycache__"
+        nested.mkdir(parents=True)
+        (nested / "mod.pyc").write_bytes(b"\x00" * 100)
+
+        scanner = Scanner(exclude=frozenset({"node_modules", "vendor"}))
+        result = scanner.scan(mock_project)
+
+        names = {t.path.name for t in result.targets}
+        assert "node_modules" not in names
+        assert nested not in {t.path for t in result.targets}
+        assert "__pycache__" in names
+
+
+class TestPatternMatcher:
+    """Tests for PatternMatcher."""
+
+    def test_agrees_with_match_patterns(self, temp_dir: Path):
+        """PatternMatcher should pick the same pattern as a linear scan."""
+        patterns = get_all_patterns_including_system_caches()
+        matcher = PatternMatcher(patterns)
+
+        names = [p for pattern in patterns for p in pattern.patterns if not p.startswith("re:")]
+        names += [
+            "com.apple.Safari.SafeBrowsing",
+            "v6-tmp",
+            "http-v2",
+            "PyCharm2024.1",
+            "notes.bak",
+            "pkg.egg-info",
+            "Discord",
+            "mod",
+            "module",
+            "src",
+        ]
+
+        for name in names:
+            path = temp_dir / name
+            expected = match_patterns(path, patterns)
+            assert matcher.match(path) is expected, name
+            assert matcher.match_entry(name, str(path)) is expected, name
+
+    def test_no_match(self, temp_dir: Path):
+        matcher = PatternMatcher(get_all_patterns_including_system_caches())
+        assert matcher.match(temp_dir / "definitely-not-bloat") is None
+
+
+class TestCollectPatternMatches:
+    """Tests for collect_pattern_matches."""
+
+    def test_walks_several_roots(self, temp_dir: Path):
+        """Matches from every root should be collected, and matching roots kept whole."""
+        matcher = PatternMatcher(get_all_patterns_including_system_caches())
+        first = temp_dir / "first"
+        (first / "app" / "node_modules").mkdir(parents=True)
+        second = temp_dir / "second"
+        (second / "__pycache__").mkdir(parents=True)
+        matching_root = temp_dir / "node_modules"
+        (matching_root / "nested" / "__pycache__").mkdir(parents=True)
+
+        matches: list = []
+        errors: list[str] = []
+        visited: list[str] = []
+        collect_pattern_matches(
+            [first, second, matching_root], matches, errors, matcher.match_entry,
+            on_dir=visited.append,
+        )
+
+        assert sorted(path for path, _ in matches) == sorted(
+            str(p) for p in [first / "app" / "node_modules", second / "__pycache__", matching_root]
+        )
+        assert errors == []
+        assert str(matching_root) not in visited
+
+    def test_overlapping_roots_report_once(self, temp_dir: Path):
+        """A directory reachable from several roots should only be matched once."""
+        matcher = PatternMatcher(get_all_patterns_including_system_caches())
+        (temp_dir / "app" / "node_modules").mkdir(parents=True)
+
+        matches: list = []
+        collect_pattern_matches(
+            [temp_dir, temp_dir / "app", temp_dir], matches, [], matcher.match_entry
+        )
+
+        assert [path for path, _ in matches] == [str(temp_dir / "app" / "node_modules")]
+
+    def test_skips_vcs_metadata(self, temp_dir: Path):
+        """Walks should not descend into VCS metadata directories."""
+        matcher = PatternMatcher(get_system_cache_patterns())
+        (temp_dir / ".git" / "modules" / "Cache").mkdir(parents=True)
+        (temp_dir / "app" / "Cache").mkdir(parents=True)
+
+        matches: list = []
+        collect_pattern_matches([temp_dir], matches, [], matcher.match_entry)
+
+        assert [path for path, _ in matches] == [str(temp_dir / "app" / "Cache")]
+
+    def test_missing_root_is_reported(self, temp_dir: Path):
+        matcher = PatternMatcher(get_all_patterns_including_system_caches())
+        matches: list = []
+        errors: list[str] = []
+
+        collect_pattern_matches([temp_dir / "missing"], matches, errors, matcher.match_entry)
+
+        assert matches == []
+        assert len(errors) == 1
+
+
+class TestSizingReporter:
+    """Tests for sizing_reporter."""
+
+    def test_throttles_updates_and_completes(self):
+        """Updates within one redraw interval are skipped, but the last result lands."""
+        progress = Progress(console=Console(quiet=True))
+        task = progress.add_task("Calculating sizes...", total=3)
+        report = sizing_reporter(progress, task, 3)
+
+        report("/a/first")
+        report("/a/second")
+        assert progress.tasks[0].completed == 1
+
+        report("/a/third")
+        assert progress.tasks[0].completed == 3
+        assert progress.tasks[0].description == "Sizing: third"
+
 
 class TestParseSize:
     """Tests for parse_size function."""
@@ -146,6 +330,50 @@ class TestParseSize:
         with pytest.raises(ValueError):
             parse_size("")
 
+    def test_parse_invalid_error_messages(self):
+        with pytest.raises(ValueError, match="^Invalid size value: ABCMB$"):
+            parse_size("abcMB")
+        with pytest.raises(ValueError, match="^Invalid size string: ABC$"):
+            parse_size(" abc ")
+        with pytest.raises(ValueError, match="^Size cannot be negative: -10MB$"):
+            parse_size("-10mb")
+
+    def test_parse_exponent(self):
+        assert parse_size("1e3") == 1000
+        assert parse_size("1.5E3KB") == 1500 * 1024
+        assert parse_size("+2MB") == 2 * 1024 * 1024
+
+    def test_parse_underscores(self):
+        assert parse_size("1_000") == 1000
+        assert parse_size("1_024KB") == 1024 * 1024
+        with pytest.raises(ValueError):
+            parse_size("1__000")
+
+    def test_parse_overflow_raises_value_error(self):
+        with pytest.raises(ValueError, match="^Invalid size string: 1E400$"):
+            parse_size("1e400")
+        with pytest.raises(ValueError, match="^Invalid size value: 1E400MB$"):
+            parse_size("1e400MB")
+        with pytest.raises(ValueError, match="^Invalid size value: 1E308TB$"):
+            parse_size("1e308TB")
+
+    def test_parse_binary_and_short_units(self):
+        assert parse_size("2MiB") == 2 * 1024 * 1024
+        assert parse_size("10k") == 10 * 1024
+        assert parse_size("1 GB") == 1024 * 1024 * 1024
+
+    def test_parse_non_finite_raises_value_error(self):
+        with pytest.raises(ValueError):
+            parse_size("inf")
+        with pytest.raises(ValueError):
+            parse_size("nanMB")
+
+    def test_parse_is_memoized(self):
+        parse_size("7MB")
+        hits = parse_size.cache_info().hits
+        assert parse_size("7MB") == 7 * 1024 * 1024
+        assert parse_size.cache_info().hits == hits + 1
+
     def test_parse_negative_raises_value_error(self):
         with pytest.raises(ValueError, match="cannot be negative"):
             parse_size("-10MB")